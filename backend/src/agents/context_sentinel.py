@@ -26,6 +26,7 @@ Inter-Agent Messages (from src.models.messages):
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 import os
@@ -485,7 +486,7 @@ def _try_parse_json_array(responses: List[str]) -> List[Dict]:
 async def _poll_calendar(user_context: Dict[str, Any]) -> List[Dict]:
     """Poll Google Calendar via Composio direct SDK for upcoming events.
 
-    Uses ComposioService.list_events() — no LLM in the loop.
+    Uses ComposioService.a_list_events() — no LLM in the loop.
     Falls back to MCP orchestrator if direct SDK fails.
     """
     now = datetime.now(timezone.utc)
@@ -493,7 +494,7 @@ async def _poll_calendar(user_context: Dict[str, Any]) -> List[Dict]:
 
     try:
         svc = _get_direct_composio()
-        result = svc.list_events(
+        result = await svc.a_list_events(
             time_min=now.isoformat(),
             time_max=end.isoformat(),
             max_results=50,
@@ -528,7 +529,7 @@ async def _poll_calendar(user_context: Dict[str, Any]) -> List[Dict]:
 async def _poll_gmail(user_context: Dict[str, Any]) -> List[Dict]:
     """Poll Gmail via Composio direct SDK for recent messages.
 
-    Uses ComposioService.fetch_emails() — no LLM in the loop.
+    Uses ComposioService.a_fetch_emails() — no LLM in the loop.
     Falls back to MCP orchestrator if direct SDK fails.
     """
     lookback = datetime.now(timezone.utc) - timedelta(hours=GMAIL_LOOKBACK_HOURS)
@@ -536,7 +537,7 @@ async def _poll_gmail(user_context: Dict[str, Any]) -> List[Dict]:
     try:
         svc = _get_direct_composio()
         query = f"after:{int(lookback.timestamp())}"
-        result = svc.fetch_emails(query=query, max_results=20)
+        result = await svc.a_fetch_emails(query=query, max_results=20)
         if result.get("successful", False):
             data = result.get("data", result)
             if isinstance(data, list):
@@ -569,7 +570,6 @@ async def _poll_slack(user_context: Dict[str, Any]) -> List[Dict]:
     Slack doesn't have a direct Composio tool equivalent that's reliable,
     so we keep the MCP orchestrator approach.
     """
-    orchestrator = _get_orchestrator()
     lookback = datetime.now(timezone.utc) - timedelta(hours=1)
 
     prompt = f"""Retrieve messages from the #general Slack channel posted after {lookback.isoformat()}.
@@ -585,6 +585,7 @@ If no new messages, return: []
 Return ONLY valid JSON, no other text."""
 
     try:
+        orchestrator = _get_orchestrator()
         responses = await orchestrator.execute_operation(
             prompt,
             system_context=(
@@ -650,7 +651,7 @@ async def poll_context_signals(ctx: Context):
 
     Flow:
     1. Load existing user context from Redis cache
-    2. Poll Google Calendar, Gmail, Slack via Composio MCP
+    2. Poll Google Calendar, Gmail, Slack concurrently via Composio
     3. Compare with cached state to detect changes
     4. Emit ContextChangeEvent for each detected change
     5. Update cache with latest state
@@ -663,9 +664,16 @@ async def poll_context_signals(ctx: Context):
     user_context = _get_user_context_from_redis()
     all_events: List[ContextChangeEvent] = []
 
+    # Sources are independent — fetch them concurrently, then diff in order.
+    # Each _poll_* logs its own failures and returns [] so gather never raises.
+    current_calendar, current_gmail, current_slack = await asyncio.gather(
+        _poll_calendar(user_context),
+        _poll_gmail(user_context),
+        _poll_slack(user_context),
+    )
+
     # 2. Poll Google Calendar
     try:
-        current_calendar = await _poll_calendar(user_context)
         cached_calendar = user_context.get("last_calendar_state")
         calendar_changes = _detect_calendar_changes(current_calendar, cached_calendar)
         all_events.extend(calendar_changes)
@@ -677,7 +685,6 @@ async def poll_context_signals(ctx: Context):
 
     # 3. Poll Gmail
     try:
-        current_gmail = await _poll_gmail(user_context)
         cached_gmail = user_context.get("last_gmail_state")
         email_changes = _detect_email_changes(current_gmail, cached_gmail)
         all_events.extend(email_changes)
@@ -689,7 +696,6 @@ async def poll_context_signals(ctx: Context):
 
     # 4. Poll Slack
     try:
-        current_slack = await _poll_slack(user_context)
         cached_slack = user_context.get("last_slack_state")
         slack_changes = _detect_slack_changes(current_slack, cached_slack)
         all_events.extend(slack_changes)
@@ -70,6 +70,7 @@ from src.models.messages import (
     UserProfile,
     VoiceCommand,
 )
+from src.models.draft import load_draft
 from src.models.task import Task, TaskStatus
 from src.engine.lts import plan_day, replan_remaining
 from src.engine.mts import handle_disruption
@@ -655,9 +656,7 @@ def create_ghost_worker(port: int = 8005) -> Agent:
                 await ctx.send(SCHEDULER_KERNEL_ADDRESS, completion)
             return
 
-        draft = _store_draft(draft_id, task, draft_body, cost)
-        r = _get_redis_client()
-        r.hset(f"ghostworker:draft:{draft_id}", "sender_address", sender)
+        _store_draft(draft_id, task, draft_body, cost, sender_address=sender)
         logger.info("Draft %s awaiting user approval", draft_id)
 
     @agent.on_interval(period=APPROVAL_POLL_INTERVAL)
@@ -680,8 +679,8 @@ def create_ghost_worker(port: int = 8005) -> Agent:
                 continue
 
             r = _get_redis_client()
-            draft_data = r.hgetall(f"ghostworker:draft:{draft_id}")
-            if not draft_data:
+            draft_data = load_draft(r, draft_id)
+            if draft_data is None:
                 continue
 
             task_id = draft_data.get("task_id", "")
@@ -701,10 +700,13 @@ def create_ghost_worker(port: int = 8005) -> Agent:
                     await ctx.send(sender_address, completion)
 
             elif action == "reject":
-                r.hset(f"ghostworker:draft:{draft_id}", "status", "rejected")
-                r.srem("ghostworker:pending", draft_id)
                 event = {"event": "draft_rejected", "draft_id": draft_id, "task_id": task_id}
-                r.publish("ghostworker:events", json.dumps(event))
+                draft_data["status"] = "rejected"
+                pipe = r.pipeline(transaction=False)
+                pipe.hset("ghostworker:drafts", draft_id, json.dumps(draft_data))
+                pipe.srem("ghostworker:pending", draft_id)
+                pipe.publish("ghostworker:events", json.dumps(event))
+                pipe.execute()
                 completion = TaskCompletion(
                     task_id=task_id,
                     status="failed",
@@ -797,6 +799,7 @@ def create_profiler_agent(port: int = 8005) -> Agent:
 
     def _load_data_and_compute() -> Dict[str, Any]:
         """Load all data sources and run the full profiling pipeline."""
+        from src.agents.profiler_agent import cache_profiler_result
         from src.data_pipeline.parsers import (
             parse_daily_goals,
             parse_linkedin,
@@ -843,7 +846,9 @@ def create_profiler_agent(port: int = 8005) -> Agent:
         # Persist temporal tracker to Redis
         r = _get_redis_client()
         r.set("profiler:temporal_tracker", engine.temporal_tracker.to_redis_payload())
-        r.set("profiler:last_result", json.dumps(result, default=str))
+        # No expiry: this agent recomputes every PROFILER_RECOMPUTE_INTERVAL,
+        # and the last good profile must survive a failed recompute
+        cache_profiler_result(r, result, ttl=None)
 
         return result
 
@@ -14,7 +14,8 @@ import os
 import time
 import uuid
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional
 
 import redis
 from uagents import Agent, Context
@@ -26,6 +27,7 @@ from src.config.settings import (
     COMPOSIO_USER_ID,
     REDIS_URL,
 )
+from src.models.draft import load_draft
 from src.models.messages import DelegationTask, TaskCompletion
 from src.agents.protocols import create_chat_protocol
 
@@ -108,6 +110,24 @@ TASK_SYSTEM_PROMPTS: Dict[str, str] = {
     ),
 }
 
+# Execution prompts for approved drafts, keyed by task type. Frozen at import;
+# only the selected template is formatted per execution.
+EXECUTION_PROMPTS: Mapping[str, str] = MappingProxyType({
+    "email_reply": (
+        "Send an email to {recipient} with subject '{subject}' "
+        "and the following body:\n\n{body}"
+    ),
+    "slack_message": (
+        "Send a message to Slack channel #{channel} "
+        "with the following text:\n\n{body}"
+    ),
+    "linkedin_post": "Publish the following LinkedIn post:\n\n{body}",
+    "meeting_reschedule": "Send a calendar invite/reschedule notification:\n\n{body}",
+    "cancel_appointment": "Send the following cancellation message:\n\n{body}",
+    "doc_update": "Update the document with:\n\n{body}",
+})
+_DEFAULT_EXECUTION_PROMPT = "Execute: {body}"
+
 # Default cost per task type (in FET)
 TASK_COSTS: Dict[str, float] = {
     "email_reply": 0.001,
@@ -200,8 +220,12 @@ def _store_draft(
     task: DelegationTask,
     body: str,
     cost_fet: float,
+    sender_address: str = "",
 ) -> dict:
-    """Store a draft in Redis and publish event for server relay."""
+    """Store a draft in Redis and publish event for server relay.
+
+    The hash write, pending-set add and publish go out in one pipeline.
+    """
     r = _get_redis_client()
 
     draft = {
@@ -215,21 +239,23 @@ def _store_draft(
         "cost_fet": cost_fet,
         "status": "pending",
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "sender_address": "",  # populated by handler with Kernel address
+        "sender_address": sender_address,  # Kernel address for TaskCompletion routing
     }
 
-    # Store draft as Redis hash
-    r.hset(f"ghostworker:draft:{draft_id}", mapping=draft)
-    # Add to pending set
-    r.sadd("ghostworker:pending", draft_id)
-
     # Publish event for server to relay via WebSocket
     event = {
         "event": "draft_created",
         "draft_id": draft_id,
         "draft": draft,
     }
-    r.publish("ghostworker:events", json.dumps(event))
+
+    pipe = r.pipeline(transaction=False)
+    # All drafts live in one hash (field=draft_id, value=JSON draft)
+    pipe.hset("ghostworker:drafts", draft_id, json.dumps(draft))
+    # Add to pending set
+    pipe.sadd("ghostworker:pending", draft_id)
+    pipe.publish("ghostworker:events", json.dumps(event))
+    pipe.execute()
 
     logger.info("Draft %s stored and published (task_type=%s)", draft_id, task.task_type)
     return draft
@@ -241,7 +267,7 @@ async def _execute_draft(draft_id: str, body_override: Optional[str] = None) ->
     Returns the execution result dict.
     """
     r = _get_redis_client()
-    draft_data = r.hgetall(f"ghostworker:draft:{draft_id}")
+    draft_data = load_draft(r, draft_id)
 
     if not draft_data:
         logger.error("Draft %s not found in Redis", draft_id)
@@ -251,31 +277,12 @@ async def _execute_draft(draft_id: str, body_override: Optional[str] = None) ->
     body = body_override or draft_data.get("body", "")
 
     # Build execution prompt based on task type
-    execution_prompts = {
-        "email_reply": (
-            f"Send an email to {draft_data.get('recipient', '')} "
-            f"with subject '{draft_data.get('subject', '')}' "
-            f"and the following body:\n\n{body}"
-        ),
-        "slack_message": (
-            f"Send a message to Slack channel #{draft_data.get('channel', 'general')} "
-            f"with the following text:\n\n{body}"
-        ),
-        "linkedin_post": (
-            f"Publish the following LinkedIn post:\n\n{body}"
-        ),
-        "meeting_reschedule": (
-            f"Send a calendar invite/reschedule notification:\n\n{body}"
-        ),
-        "cancel_appointment": (
-            f"Send the following cancellation message:\n\n{body}"
-        ),
-        "doc_update": (
-            f"Update the document with:\n\n{body}"
-        ),
-    }
-
-    prompt = execution_prompts.get(task_type, f"Execute: {body}")
+    prompt = EXECUTION_PROMPTS.get(task_type, _DEFAULT_EXECUTION_PROMPT).format(
+        recipient=draft_data.get("recipient", ""),
+        subject=draft_data.get("subject", ""),
+        channel=draft_data.get("channel", "general"),
+        body=body,
+    )
 
     try:
         orchestrator = _get_orchestrator()
@@ -296,10 +303,6 @@ async def _execute_draft(draft_id: str, body_override: Optional[str] = None) ->
             "error": str(exc),
         }
 
-    # Update draft status in Redis
-    r.hset(f"ghostworker:draft:{draft_id}", "status", result["status"])
-    r.srem("ghostworker:pending", draft_id)
-
     # Publish execution event
     event = {
         "event": f"draft_{result['status']}",
@@ -307,7 +310,14 @@ async def _execute_draft(draft_id: str, body_override: Optional[str] = None) ->
         "task_id": draft_data.get("task_id", ""),
         "result": result,
     }
-    r.publish("ghostworker:events", json.dumps(event))
+
+    # Update draft status in Redis
+    draft_data["status"] = result["status"]
+    pipe = r.pipeline(transaction=False)
+    pipe.hset("ghostworker:drafts", draft_id, json.dumps(draft_data))
+    pipe.srem("ghostworker:pending", draft_id)
+    pipe.publish("ghostworker:events", json.dumps(event))
+    pipe.execute()
 
     return result
 
@@ -364,13 +374,8 @@ async def handle_delegation(ctx: Context, sender: str, task: DelegationTask):
             await ctx.send(SCHEDULER_KERNEL_ADDRESS, completion)
         return
 
-    # Store draft for user approval
-    draft = _store_draft(draft_id, task, draft_body, cost)
-    draft["sender_address"] = sender
-
-    # Update Redis with sender for later TaskCompletion routing
-    r = _get_redis_client()
-    r.hset(f"ghostworker:draft:{draft_id}", "sender_address", sender)
+    # Store draft for user approval (with sender for later TaskCompletion routing)
+    _store_draft(draft_id, task, draft_body, cost, sender_address=sender)
 
     logger.info("Draft %s awaiting user approval", draft_id)
 
@@ -403,14 +408,13 @@ async def poll_approvals(ctx: Context):
             continue
 
         r = _get_redis_client()
-        draft_data = r.hgetall(f"ghostworker:draft:{draft_id}")
+        draft_data = load_draft(r, draft_id)
 
-        if not draft_data:
+        if draft_data is None:
             logger.warning("Approval for unknown draft %s", draft_id)
             continue
 
         task_id = draft_data.get("task_id", "")
-        task_type = draft_data.get("task_type", "")
         cost_fet = float(draft_data.get("cost_fet", 0.001))
         sender_address = draft_data.get("sender_address", SCHEDULER_KERNEL_ADDRESS)
 
@@ -430,8 +434,6 @@ async def poll_approvals(ctx: Context):
 
         elif action == "reject":
             logger.info("Draft %s rejected", draft_id)
-            r.hset(f"ghostworker:draft:{draft_id}", "status", "rejected")
-            r.srem("ghostworker:pending", draft_id)
 
             # Publish rejection event
             event = {
@@ -439,7 +441,12 @@ async def poll_approvals(ctx: Context):
                 "draft_id": draft_id,
                 "task_id": task_id,
             }
-            r.publish("ghostworker:events", json.dumps(event))
+            draft_data["status"] = "rejected"
+            pipe = r.pipeline(transaction=False)
+            pipe.hset("ghostworker:drafts", draft_id, json.dumps(draft_data))
+            pipe.srem("ghostworker:pending", draft_id)
+            pipe.publish("ghostworker:events", json.dumps(event))
+            pipe.execute()
 
             completion = TaskCompletion(
                 task_id=task_id,
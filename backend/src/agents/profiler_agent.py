@@ -16,6 +16,7 @@ from __future__ import annotations
 import json
 import logging
 import math
+import re
 import statistics
 import time
 from dataclasses import dataclass, field
@@ -410,14 +411,14 @@ class SentimentAnalyzer:
         "comfortable", "waste", "struggle", "stuck", "confused",
         "frustrated", "lost", "behind", "overcommitted", "scattered",
     }
+    WORD_RE = re.compile(r"[a-z']+")
 
     def analyze(self, text: str) -> dict[str, Any]:
         """Return sentiment analysis for a text block."""
         if not text.strip():
             return {"label": "neutral", "score": 0.0, "word_count": 0}
 
-        import re
-        words = set(re.findall(r"[a-z']+", text.lower()))
+        words = set(self.WORD_RE.findall(text.lower()))
         pos = len(words & self.POSITIVE_WORDS)
         neg = len(words & self.NEGATIVE_WORDS)
         total = pos + neg
@@ -922,3 +923,48 @@ class ProfilerEngine:
             "sentiment": sentiment,
             "temporal_drift": drift,
         }
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Result cache (shared by the Profiler Agent and the API server)
+# ═══════════════════════════════════════════════════════════════════════════
+
+PROFILER_RESULT_KEY = "profiler:last_result"
+PROFILER_SECTIONS_KEY = "profiler:last_result:sections"
+PROFILER_CACHE_TTL = 1800  # seconds, for results the API server computes on demand
+
+
+def cache_profiler_result(
+    r, result: dict[str, Any], ttl: int | None = PROFILER_CACHE_TTL,
+) -> None:
+    """Cache a profiler result as a whole blob plus per-section hash fields.
+
+    Endpoints that only need a couple of sections (user_profile, grouping)
+    read them from the hash instead of transferring the full profile.  Both
+    keys get the same TTL so the two views never disagree; ``ttl=None``
+    stores them without expiry (the Profiler Agent refreshes them itself).
+    """
+    pipe = r.pipeline(transaction=False)
+    pipe.set(PROFILER_RESULT_KEY, json.dumps(result, default=str), ex=ttl)
+    pipe.delete(PROFILER_SECTIONS_KEY)
+    pipe.hset(PROFILER_SECTIONS_KEY, mapping={
+        k: json.dumps(v, default=str) for k, v in result.items()
+    })
+    if ttl is not None:
+        pipe.expire(PROFILER_SECTIONS_KEY, ttl)
+    pipe.execute()
+
+
+def load_profiler_sections(r, *sections: str) -> list[dict[str, Any]] | None:
+    """Fetch selected top-level sections of the cached profile via HMGET.
+
+    Returns the decoded sections in the order requested, or None if any
+    section is missing (e.g. the cache was written before sections existed).
+    """
+    raw = r.hmget(PROFILER_SECTIONS_KEY, *sections)
+    if any(v is None for v in raw):
+        return None
+    try:
+        return [json.loads(v) for v in raw]
+    except (json.JSONDecodeError, TypeError):
+        return None
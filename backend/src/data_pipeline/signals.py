@@ -8,6 +8,7 @@ objects ready for embedding and storage in Redis.
 from __future__ import annotations
 
 import json
+import statistics
 import uuid
 from dataclasses import dataclass, field
 from typing import Any
@@ -386,7 +387,6 @@ def _classify_daily_goals(
     ))
 
     # Implicit: procrastination / consistency pattern
-    import statistics
     if len(completion_rates) >= 2:
         stddev = statistics.stdev(completion_rates)
     else:
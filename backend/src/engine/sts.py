@@ -42,18 +42,38 @@ class ShortTermScheduler:
         # Tasks delegated to GhostWorker
         self._delegation_queue: list[Task] = []
 
-    def enqueue(self, task: Task) -> None:
-        """Add a task to the appropriate priority queue."""
+    def _entry_for(self, task: Task) -> tuple[int, _QueueEntry]:
+        """Classify ``task`` and build its queue entry; returns (priority, entry)."""
         priority = self._classify_priority(task)
         task.priority = priority
         # Sort within priority level by deadline urgency (higher urgency = lower sort_key)
-        sort_key = -task.deadline_urgency
-        heapq.heappush(self._queues[priority], _QueueEntry(sort_key, task))
+        return priority, _QueueEntry(-task.deadline_urgency, task)
+
+    def enqueue(self, task: Task) -> None:
+        """Add a task to the appropriate priority queue."""
+        priority, entry = self._entry_for(task)
+        heapq.heappush(self._queues[priority], entry)
 
     def enqueue_batch(self, tasks: list[Task]) -> None:
-        """Add multiple tasks, then rebalance."""
+        """Add multiple tasks, heapifying each touched queue once.
+
+        Same placement as calling enqueue() per task, but O(n) overall
+        instead of one heappush per task.
+        """
+        touched = set()
         for task in tasks:
-            self.enqueue(task)
+            priority, entry = self._entry_for(task)
+            self._queues[priority].append(entry)
+            touched.add(priority)
+        for priority in touched:
+            heapq.heapify(self._queues[priority])
+
+    @classmethod
+    def from_tasks(cls, tasks: list[Task]) -> ShortTermScheduler:
+        """Build a scheduler with ``tasks`` already queued."""
+        sts = cls()
+        sts.enqueue_batch(tasks)
+        return sts
 
     def dequeue(self, energy_level: int = 5) -> Optional[Task]:
         """Get the next task to execute, respecting energy constraints.
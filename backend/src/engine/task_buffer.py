@@ -8,6 +8,7 @@ Provides O(1) bucket lookup + O(k) scan within bucket for MTS swap candidates.
 
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Optional
 
 import redis
@@ -69,6 +70,16 @@ def get_backlog_tasks(r: redis.Redis | None = None) -> list[Task]:
     return tasks
 
 
+def get_backlog_ids(r: redis.Redis | None = None) -> set[str]:
+    """Get backlog task IDs straight from the status index.
+
+    Loads no task hashes, so it suits membership checks; unlike
+    get_backlog_tasks() it does not re-check each task's stored status.
+    """
+    r = r or _get_redis()
+    return r.smembers(BACKLOG_KEY)
+
+
 def get_active_tasks(r: redis.Redis | None = None) -> list[Task]:
     """Get all tasks in today's active schedule."""
     r = r or _get_redis()
@@ -115,7 +126,6 @@ def find_swap_candidates(
 
     # If we know peak hours, prefer high-cognitive tasks during peaks
     if peak_hours:
-        from datetime import datetime, timezone
         current_hour = datetime.now(timezone.utc).hour
         is_peak = current_hour in peak_hours
         if is_peak:
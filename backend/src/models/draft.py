@@ -0,0 +1,65 @@
+"""GhostWorker draft storage.
+
+Drafts live as JSON values in one ``ghostworker:drafts`` hash (field =
+draft id); ids awaiting review are in the ``ghostworker:pending`` set.
+Drafts written before that layout sit in per-draft ``ghostworker:draft:{id}``
+hashes and are moved into the shared hash the first time they are read.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Iterable, Optional
+
+import redis
+
+DRAFTS_KEY = "ghostworker:drafts"
+PENDING_KEY = "ghostworker:pending"
+LEGACY_DRAFT_PREFIX = "ghostworker:draft:"
+DEFAULT_COST_FET = 0.001
+
+
+def _decode(raw) -> Optional[dict]:
+    try:
+        return json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+def _migrate_legacy(r: redis.Redis, draft_id: str) -> Optional[dict]:
+    """Move a pre-JSON per-draft hash into the shared drafts hash."""
+    legacy_key = f"{LEGACY_DRAFT_PREFIX}{draft_id}"
+    draft = r.hgetall(legacy_key)
+    if not draft:
+        return None
+    # Legacy hashes stored every field as a string
+    try:
+        draft["cost_fet"] = float(draft.get("cost_fet", DEFAULT_COST_FET))
+    except (TypeError, ValueError):
+        draft["cost_fet"] = DEFAULT_COST_FET
+    pipe = r.pipeline(transaction=False)
+    pipe.hset(DRAFTS_KEY, draft_id, json.dumps(draft))
+    pipe.delete(legacy_key)
+    pipe.execute()
+    return draft
+
+
+def load_draft(r: redis.Redis, draft_id: str) -> Optional[dict]:
+    """Read one draft, or None if it is absent or undecodable."""
+    raw = r.hget(DRAFTS_KEY, draft_id)
+    if raw is None:
+        return _migrate_legacy(r, draft_id)
+    return _decode(raw)
+
+
+def load_drafts(r: redis.Redis, draft_ids: Iterable[str]) -> list[dict]:
+    """Read several drafts with one HMGET, skipping missing or corrupt ones."""
+    ids = list(draft_ids)
+    if not ids:
+        return []
+    drafts = []
+    for draft_id, raw in zip(ids, r.hmget(DRAFTS_KEY, ids)):
+        draft = _migrate_legacy(r, draft_id) if raw is None else _decode(raw)
+        if draft is not None:
+            drafts.append(draft)
+    return drafts
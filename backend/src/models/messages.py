@@ -1,13 +1,75 @@
 """Typed message models for inter-agent communication.
 
 All messages are uAgents Model subclasses providing schema validation
-and serialization across the Fetch.ai ecosystem.
+and serialization across the Fetch.ai ecosystem.  They share ORJSONModel,
+which swaps the stdlib json codec for orjson.
 """
 
+import json
+import sys
+
+import orjson
+from pydantic.v1 import validator
+from pydantic.v1.json import pydantic_encoder
 from uagents import Model
 
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_dumps(v, *, default, **dumps_kwargs) -> str:
+    # Formatting options (schema_json's indent/sort_keys, which feed the
+    # uAgents schema digest) keep the stdlib encoder so digests don't change.
+    if dumps_kwargs:
+        return json.dumps(v, default=default, **dumps_kwargs)
+    return orjson.dumps(v, default=default, option=_ORJSON_OPTS).decode()
+
+
+def _interned(*fields: str):
+    """Validator interning closed-vocabulary string fields (event types,
+    severities, actions...), so every parsed message shares one object per
+    value instead of allocating a fresh str."""
+    def _intern(cls, v):
+        return sys.intern(v) if isinstance(v, str) else v
+    return validator(*fields, pre=True, allow_reuse=True)(_intern)
+
+
+class ORJSONModel(Model):
+    """uAgents Model whose .json()/.parse_raw() go through orjson."""
+
+    class Config:
+        json_loads = orjson.loads
+        json_dumps = _orjson_dumps
+
+    # Messages declare no field aliases, so the instance __dict__ already is
+    # the .dict() output; encoding it directly skips v1's per-field copy.
+    # Any nested model still goes through pydantic_encoder.
+
+    def model_bytes(self) -> bytes:
+        """Serialize straight to JSON bytes, skipping the str round-trip."""
+        return orjson.dumps(self.__dict__, default=pydantic_encoder, option=_ORJSON_OPTS)
+
+    @classmethod
+    def dump_many(cls, items) -> bytes:
+        """Serialize several messages as one JSON array in a single orjson call."""
+        return orjson.dumps(
+            [item.__dict__ for item in items], default=pydantic_encoder, option=_ORJSON_OPTS,
+        )
 
-class ContextChangeEvent(Model):
+    @classmethod
+    def parse_bytes_fast(cls, data: bytes | str):
+        """Load a payload produced by model_bytes()/json() of this model.
+
+        Models without custom validators are built with construct(), which
+        skips field validation — only use this for trusted payloads such
+        as our own serialized messages, never for inbound agent traffic.
+        """
+        obj = orjson.loads(data)
+        if cls.__validators__ or cls.__pre_root_validators__ or cls.__post_root_validators__:
+            return cls.parse_obj(obj)
+        return cls.construct(**obj)
+
+
+class ContextChangeEvent(ORJSONModel):
     """Emitted by Context Sentinel when a real-time signal changes."""
     event_type: str          # meeting_ended_early | new_email | schedule_conflict | task_completed
     source: str              # google_calendar | gmail | slack
@@ -15,8 +77,10 @@ class ContextChangeEvent(Model):
     affected_task_ids: list  # task IDs impacted
     metadata: dict           # source-specific data (new end time, email subject, etc.)
 
+    _intern_vocab = _interned("event_type", "source")
 
-class UserProfile(Model):
+
+class UserProfile(ORJSONModel):
     """Returned by Profiler Agent with learned behavioral patterns."""
     peak_hours: list         # [9, 10, 14, 15] (24h format)
     avg_task_durations: dict # {'email': 5, 'deep_work': 52, 'admin': 15}
@@ -27,13 +91,13 @@ class UserProfile(Model):
     automation_comfort: dict # {'email': 0.9, 'slack': 0.8, 'booking': 0.5}
 
 
-class ProfileQuery(Model):
+class ProfileQuery(ORJSONModel):
     """Request to Profiler Agent for user patterns."""
     query_type: str          # full_profile | peak_hours | estimation_bias
     user_id: str
 
 
-class DisruptionEvent(Model):
+class DisruptionEvent(ORJSONModel):
     """Emitted by Disruption Detector after classifying a context change."""
     severity: str            # minor | major | critical
     affected_task_ids: list
@@ -41,37 +105,50 @@ class DisruptionEvent(Model):
     recommended_action: str  # swap_in | swap_out | reschedule_all | delegate
     context_summary: str     # human-readable explanation
 
+    _intern_vocab = _interned("severity", "recommended_action")
+
 
-class EnergyLevel(Model):
+class EnergyLevel(ORJSONModel):
     """Returned by Energy Monitor with current energy state."""
     level: int               # 1-5
     confidence: float        # 0.0-1.0
     source: str              # inferred | user_reported | time_based
 
+    _intern_vocab = _interned("source")
+
+    class Config:
+        # Shared as a module-level default by the agents; frozen also makes
+        # readings hashable so repeated ones can be deduplicated.
+        frozen = True
 
-class EnergyQuery(Model):
+
+class EnergyQuery(ORJSONModel):
     """Request to Energy Monitor for current energy level."""
     user_id: str
     timestamp: str           # ISO 8601
 
 
-class SwapOperation(Model):
+class SwapOperation(ORJSONModel):
     """A single swap action performed by the MTS."""
     action: str              # swap_in | swap_out | preempt | delegate
     task_id: str
     reason: str              # human-readable
     new_time_slot: str       # ISO 8601 start time (empty string if swapped out)
 
+    _intern_vocab = _interned("action")
+
 
-class UpdatedSchedule(Model):
+class UpdatedSchedule(ORJSONModel):
     """Emitted by Scheduler Kernel after rescheduling."""
     schedule: list           # list of scheduled task dicts with time slots
     swaps: list              # list of SwapOperation dicts
     timestamp: str           # ISO 8601
     trigger: str             # disruption | daily_plan | manual
 
+    _intern_vocab = _interned("trigger")
+
 
-class DelegationTask(Model):
+class DelegationTask(ORJSONModel):
     """Sent to GhostWorker for autonomous execution."""
     task_id: str
     task_type: str           # email_reply | slack_message | uber_book | cancel_appointment
@@ -80,21 +157,25 @@ class DelegationTask(Model):
     max_cost_fet: float      # spending limit for this task
 
 
-class TaskCompletion(Model):
+class TaskCompletion(ORJSONModel):
     """Returned by GhostWorker after task execution."""
     task_id: str
     status: str              # drafted | executed | failed
     result: dict             # output data (draft text, confirmation, error)
     cost_fet: float          # actual cost charged
 
+    _intern_vocab = _interned("status")
 
-class ScheduleRequest(Model):
+
+class ScheduleRequest(ORJSONModel):
     """Request to Scheduler Kernel for on-demand scheduling."""
     action: str              # plan_day | reoptimize | add_task
     payload: dict            # action-specific data
 
+    _intern_vocab = _interned("action")
+
 
-class ProfilerGrouping(Model):
+class ProfilerGrouping(ORJSONModel):
     """User classification on the achiever spectrum (exclusive — high bar)."""
     archetype: str           # "compounding_builder" | "reliable_operator" | "emerging_talent" | "at_risk"
     execution_score: float   # 0.0-1.0 (x-axis of success function)
@@ -103,14 +184,14 @@ class ProfilerGrouping(Model):
     traits: dict             # detailed trait breakdown
 
 
-class ProfileUpdateEvent(Model):
+class ProfileUpdateEvent(ORJSONModel):
     """Emitted when profiler detects significant pattern change."""
     changed_fields: list     # which profile fields changed
     magnitude: float         # 0.0-1.0 how much changed
     timestamp: str           # ISO 8601
 
 
-class ReminderNotification(Model):
+class ReminderNotification(ORJSONModel):
     """Emitted by Reminder Agent when user should be notified."""
     reminder_type: str       # "upcoming_task" | "check_in" | "completion_check" | "transition"
     task_id: str             # related task (empty string if general)
@@ -121,7 +202,7 @@ class ReminderNotification(Model):
     timestamp: str           # ISO 8601
 
 
-class VoiceCommand(Model):
+class VoiceCommand(ORJSONModel):
     """Received from iOS/frontend when user issues a voice command."""
     command_type: str        # "complete_task" | "start_task" | "snooze_reminder" | "whats_next"
     task_id: str             # relevant task (empty string if N/A)
@@ -5,12 +5,13 @@ Redis-backed task with all fields needed by LTS/MTS/STS schedulers.
 
 from __future__ import annotations
 
+import functools
 import json
 import math
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
 from enum import IntEnum
-from typing import Optional
+from typing import Iterable, Optional
 
 import redis
 
@@ -37,6 +38,13 @@ class TaskStatus:
     DELEGATED = "delegated"
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp, memoized — scoring re-reads the same
+    deadline/preferred_start strings on every bucket and urgency pass."""
+    return datetime.fromisoformat(value)
+
+
 @dataclass
 class Task:
     task_id: str
@@ -61,7 +69,7 @@ class Task:
         if not self.deadline:
             return 0.0
         try:
-            dl = datetime.fromisoformat(self.deadline)
+            dl = _parse_iso(self.deadline)
             now = datetime.now(timezone.utc)
             hours_remaining = max((dl - now).total_seconds() / 3600, 0.1)
             # Inverse: 2 hours left → 5.0, 24 hours → ~0.4, 1 hour → 10.0
@@ -81,7 +89,7 @@ class Task:
         if not self.preferred_start:
             return 5.0  # neutral
         try:
-            ps = datetime.fromisoformat(self.preferred_start)
+            ps = _parse_iso(self.preferred_start)
             now = datetime.now(timezone.utc)
             hours_until = (ps - now).total_seconds() / 3600
             if hours_until <= 0:
@@ -124,8 +132,12 @@ class Task:
                 data[int_field] = int(val)
         return cls(**{k: v for k, v in data.items() if k in cls.__dataclass_fields__})
 
-    def to_redis(self, r: redis.Redis) -> None:
-        """Persist task to Redis hash and update bucket membership."""
+    def to_redis(self, r: redis.Redis | redis.client.Pipeline) -> None:
+        """Persist task to Redis hash and update bucket membership.
+
+        ``r`` may be a pipeline, so callers saving several tasks can queue
+        all the writes and send them in one ``execute()``.
+        """
         key = f"{TASK_PREFIX}{self.task_id}"
         self.updated_at = datetime.now(timezone.utc).isoformat()
         r.hset(key, mapping=self.to_dict())
@@ -139,6 +151,14 @@ class Task:
             r.sadd(ACTIVE_KEY, self.task_id)
             r.srem(BACKLOG_KEY, self.task_id)
 
+    @staticmethod
+    def bulk_to_redis(tasks: Iterable[Task], r: redis.Redis) -> None:
+        """Persist several tasks through one pipeline round-trip."""
+        pipe = r.pipeline(transaction=False)
+        for task in tasks:
+            task.to_redis(pipe)
+        pipe.execute()
+
     @classmethod
     def from_redis(cls, r: redis.Redis, task_id: str) -> Optional[Task]:
         """Load task from Redis by ID."""
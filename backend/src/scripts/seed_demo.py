@@ -178,9 +178,7 @@ def seed():
         ),
     ]
 
-    all_tasks = active_tasks + backlog_tasks
-    for task in all_tasks:
-        task.to_redis(r)
+    Task.bulk_to_redis(active_tasks + backlog_tasks, r)
 
     print(f"Seeded {len(active_tasks)} active tasks + {len(backlog_tasks)} backlog tasks")
     print(f"\nActive schedule:")
@@ -14,17 +14,22 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import os
 import time
 from uuid import uuid4
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+import httpx
+import orjson
 import redis
+import redis.asyncio as aioredis
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Query
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
 from src.config.settings import REDIS_URL, TASK_BUCKET_COUNT, ELEVENLABS_API_KEY, ELEVENLABS_AGENT_ID
+from src.models.draft import load_draft, load_drafts
 from src.models.task import Task, TaskStatus
 from src.engine.task_buffer import get_active_tasks, get_backlog_tasks, store_task
 from src.engine.lts import plan_day
@@ -36,7 +41,19 @@ from src.engine.disruption_classifier import (
     determine_action,
 )
 from src.services.composio_service import get_composio_service
-from src.agents.profiler_agent import ProfilerEngine
+from src.agents.profiler_agent import (
+    PROFILER_RESULT_KEY,
+    ProfilerEngine,
+    cache_profiler_result,
+    load_profiler_sections,
+)
+from src.data_pipeline.parsers import (
+    parse_daily_goals,
+    parse_linkedin,
+    parse_twitter,
+    parse_reflections,
+    parse_resume,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +71,7 @@ app.add_middleware(
 _sts = ShortTermScheduler()
 _energy_level = 3
 _peak_hours = [9, 10, 14, 15]
+_background_tasks: set[asyncio.Task] = set()
 
 PRIORITY_MAP = {0: "P0", 1: "P1", 2: "P2", 3: "P3"}
 STATUS_MAP = {
@@ -64,15 +82,55 @@ STATUS_MAP = {
     TaskStatus.BACKLOG: "buffered",
     TaskStatus.SWAPPED_OUT: "buffered",
 }
+# Task types GhostWorker can execute autonomously
+_AUTOMATABLE_TYPES: frozenset[str] = frozenset({
+    "email_reply", "slack_message", "uber_book",
+    "cancel_appointment", "doc_update", "meeting_reschedule",
+})
+
+# Static scoring config exposed by /api/schedule/intelligence
+LTS_SCORING_WEIGHTS = {
+    "deadline_urgency": 0.40,
+    "priority": 0.30,
+    "peak_alignment": 0.15,
+    "duration_efficiency": 0.15,
+}
+BUFFER_HASH_WEIGHTS = {
+    "deadline_urgency": 0.45,
+    "estimated_execution": 0.30,
+    "preferred_start": 0.25,
+}
+
+
+_redis_client: Optional[redis.Redis] = None
 
 
 def _get_redis() -> redis.Redis:
-    return redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    """Return the shared Redis client so handlers reuse pooled connections."""
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            REDIS_URL, decode_responses=True, max_connections=32,
+        )
+    return _redis_client
+
+
+def _energy_snapshot() -> dict:
+    """Current energy level in the frontend EnergyLevel shape."""
+    return {"level": _energy_level, "confidence": 0.5, "source": "time_based"}
 
 
-def _task_to_frontend(task: Task) -> dict:
-    """Convert backend Task to frontend Task format."""
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+def _utc_today() -> str:
+    """Today's UTC date as YYYY-MM-DD."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+def _task_to_frontend(task: Task, today: str) -> dict:
+    """Convert backend Task to frontend Task format.
+
+    ``today`` (YYYY-MM-DD) anchors tasks without a preferred start; callers
+    converting a batch compute it once rather than per task.
+    """
     # Use preferred_start for start_time if available, otherwise use a placeholder
     start_time = task.preferred_start or f"{today}T09:00:00"
     try:
@@ -80,12 +138,8 @@ def _task_to_frontend(task: Task) -> dict:
     except (ValueError, TypeError):
         start_dt = datetime.fromisoformat(f"{today}T09:00:00")
 
-    from datetime import timedelta
     end_dt = start_dt + timedelta(minutes=task.estimated_duration)
 
-    automatable_types = {"email_reply", "slack_message", "uber_book",
-                         "cancel_appointment", "doc_update", "meeting_reschedule"}
-
     return {
         "id": task.task_id,
         "title": task.title,
@@ -96,57 +150,200 @@ def _task_to_frontend(task: Task) -> dict:
         "energy_cost": task.energy_cost,
         "estimated_duration": task.estimated_duration,
         "status": STATUS_MAP.get(task.status, "scheduled"),
-        "delegatable": task.task_type in automatable_types,
+        "delegatable": task.task_type in _AUTOMATABLE_TYPES,
         "task_type": task.task_type if task.task_type != "general" else None,
     }
 
 
-def _build_ws_message(msg_type: str, payload: dict) -> str:
-    """Build a JSON WebSocket message matching frontend WSMessage format."""
-    return json.dumps({
+def _tasks_to_frontend(tasks: list[Task], today: Optional[str] = None) -> list[dict]:
+    """Convert a batch of Tasks, resolving today's date once."""
+    today = today or _utc_today()
+    return [_task_to_frontend(t, today) for t in tasks]
+
+
+def _fire_and_forget(coro) -> asyncio.Task:
+    """Schedule a coroutine without awaiting it (e.g. a WS broadcast).
+
+    Holds a strong reference until the task finishes so it isn't
+    garbage-collected mid-flight.
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+_now_iso_cache: tuple[int, str] = (0, "")
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as ISO 8601 at second granularity.
+
+    The string is formatted at most once per wall-clock second, so bursts
+    of WS messages (relays, disruption fan-out) share one timestamp.
+    """
+    global _now_iso_cache
+    sec = int(time.time())
+    if _now_iso_cache[0] != sec:
+        _now_iso_cache = (sec, datetime.fromtimestamp(sec, timezone.utc).isoformat())
+    return _now_iso_cache[1]
+
+
+_WS_DUMPS_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+_WS_PING = orjson.dumps({"type": "ping"})
+
+
+def _agent_activity(agent_name: str, message: str, activity_type: str = "info") -> dict:
+    """Build an agent_activity payload."""
+    return {"agent": agent_name, "message": message, "type": activity_type}
+
+
+def _build_ws_message(
+    msg_type: str, payload: dict | list, ts: Optional[str] = None,
+) -> bytes:
+    """Build a JSON WebSocket message matching frontend WSMessage format.
+
+    Encoded once to UTF-8 JSON bytes with orjson; broadcast() hands the
+    same buffer to every client, so nothing is re-serialized per
+    connection. Pass ``ts`` to stamp a batch of messages with one timestamp.
+    """
+    return orjson.dumps({
         "type": msg_type,
         "payload": payload,
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    })
+        "timestamp": ts or _utc_now_iso(),
+    }, option=_WS_DUMPS_OPTS)
 
 
 # ── WebSocket Manager ────────────────────────────────────────────────────
 
+async def _close_quietly(ws: WebSocket):
+    """Close a socket, ignoring errors if it is already gone."""
+    try:
+        await ws.close(code=1013)  # "try again later"
+    except Exception:
+        pass
+
+
 class ConnectionManager:
-    """WebSocket connection manager with heartbeat and agent activity support."""
+    """WebSocket connection manager with heartbeat and agent activity support.
+
+    Each connection gets a bounded send queue drained by its own writer
+    task, so broadcasting is a non-blocking enqueue and a slow client can
+    never stall delivery to the others.
+
+    Frames go out as text, one event per frame, unless the client lists
+    ``"binary"`` and/or ``"batch"`` in the ``capabilities`` of its
+    ``identify`` message.
+    """
 
     HEARTBEAT_INTERVAL = 30  # seconds between pings
+    SEND_QUEUE_SIZE = 256  # frames buffered per client before it is dropped
 
     def __init__(self):
-        self._connections: list[WebSocket] = []
+        self._connections: dict[WebSocket, asyncio.Queue[bytes]] = {}
+        self._writers: dict[WebSocket, asyncio.Task] = {}
+        self._capabilities: dict[WebSocket, frozenset[str]] = {}
         self._heartbeat_task: Optional[asyncio.Task] = None
 
     async def connect(self, ws: WebSocket):
         await ws.accept()
-        self._connections.append(ws)
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._connections[ws] = queue
+        self._writers[ws] = asyncio.create_task(self._writer_loop(ws, queue))
         logger.info(f"WebSocket connected. Total: {len(self._connections)}")
         # Start heartbeat if this is the first connection
         if self._heartbeat_task is None or self._heartbeat_task.done():
             self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
 
-    def disconnect(self, ws: WebSocket):
+    def set_capabilities(self, ws: WebSocket, capabilities) -> None:
+        """Record the wire options a client announced in ``identify``."""
         if ws in self._connections:
-            self._connections.remove(ws)
+            self._capabilities[ws] = frozenset(capabilities or ())
+
+    def disconnect(self, ws: WebSocket):
+        self._connections.pop(ws, None)
+        self._capabilities.pop(ws, None)
+        writer = self._writers.pop(ws, None)
+        if writer and writer is not asyncio.current_task():
+            writer.cancel()
         logger.info(f"WebSocket disconnected. Total: {len(self._connections)}")
         # Stop heartbeat if no connections remain
         if not self._connections and self._heartbeat_task and not self._heartbeat_task.done():
             self._heartbeat_task.cancel()
 
-    async def broadcast(self, message: str):
-        disconnected = []
-        for ws in self._connections:
-            try:
-                await ws.send_text(message)
-            except Exception:
-                disconnected.append(ws)
-        for ws in disconnected:
-            if ws in self._connections:
-                self._connections.remove(ws)
+    def send(self, ws: WebSocket, message: bytes):
+        """Queue a pre-serialized message for one client.
+
+        A client whose queue is full is too far behind to catch up; it is
+        dropped and closed so the frontend reconnects and resyncs.
+        """
+        queue = self._connections.get(ws)
+        if queue is None:
+            return
+        try:
+            queue.put_nowait(message)
+        except asyncio.QueueFull:
+            logger.warning("WebSocket send queue full; dropping slow client")
+            self.disconnect(ws)
+            _fire_and_forget(_close_quietly(ws))
+
+    async def broadcast(self, message: bytes):
+        """Queue a pre-serialized message for every client.
+
+        Never waits on a socket: each client's writer task delivers it.
+        """
+        for ws in list(self._connections):
+            self.send(ws, message)
+
+    async def _writer_loop(self, ws: WebSocket, queue: asyncio.Queue[bytes]):
+        """Deliver queued frames to one client until it fails or disconnects."""
+        try:
+            while True:
+                message = await queue.get()
+                try:
+                    if "binary" in self._capabilities.get(ws, ()):
+                        await ws.send_bytes(message)
+                    else:
+                        await ws.send_text(message.decode())
+                except Exception:
+                    logger.info("Removed dead WebSocket connection")
+                    self.disconnect(ws)
+                    return
+                finally:
+                    queue.task_done()
+        except asyncio.CancelledError:
+            pass
+
+    async def broadcast_batch(self, events: list[tuple[str, dict]]):
+        """Send several events, coalesced for clients that support it.
+
+        Each event is a ``(msg_type, payload)`` pair.  Clients that listed
+        ``"batch"`` in their ``identify`` capabilities get one ``batch``
+        frame and dispatch the events in order; every other client gets the
+        events as individual frames, in the same order.  Each frame is
+        encoded at most once.
+        """
+        if not self._connections:
+            return
+        ts = _utc_now_iso()
+        batch_frame: Optional[bytes] = None
+        single_frames: Optional[list[bytes]] = None
+        for ws in list(self._connections):
+            if "batch" in self._capabilities.get(ws, ()):
+                if batch_frame is None:
+                    batch_frame = _build_ws_message("batch", [
+                        {"type": msg_type, "payload": payload, "timestamp": ts}
+                        for msg_type, payload in events
+                    ], ts=ts)
+                self.send(ws, batch_frame)
+            else:
+                if single_frames is None:
+                    single_frames = [
+                        _build_ws_message(msg_type, payload, ts=ts)
+                        for msg_type, payload in events
+                    ]
+                for frame in single_frames:
+                    self.send(ws, frame)
 
     async def broadcast_agent_activity(
         self,
@@ -161,11 +358,11 @@ class ConnectionManager:
             message: Human-readable description of what happened.
             activity_type: One of info | disruption | swap | delegation | ghostworker.
         """
-        msg = _build_ws_message("agent_activity", {
-            "agent": agent_name,
-            "message": message,
-            "type": activity_type,
-        })
+        if not self._connections:
+            return
+        msg = _build_ws_message(
+            "agent_activity", _agent_activity(agent_name, message, activity_type),
+        )
         await self.broadcast(msg)
 
     async def _heartbeat_loop(self):
@@ -173,16 +370,8 @@ class ConnectionManager:
         try:
             while self._connections:
                 await asyncio.sleep(self.HEARTBEAT_INTERVAL)
-                disconnected = []
-                for ws in self._connections:
-                    try:
-                        await ws.send_json({"type": "ping"})
-                    except Exception:
-                        disconnected.append(ws)
-                for ws in disconnected:
-                    if ws in self._connections:
-                        self._connections.remove(ws)
-                        logger.info("Heartbeat: removed dead connection")
+                # Writers drop any client whose ping fails to send
+                await self.broadcast(_WS_PING)
         except asyncio.CancelledError:
             pass
 
@@ -196,22 +385,28 @@ manager = ConnectionManager()
 
 # ── WebSocket Endpoint ───────────────────────────────────────────────────
 
+async def _send_initial_schedule(ws: WebSocket):
+    """Send the current schedule snapshot to a newly connected client."""
+    try:
+        active = get_active_tasks(_get_redis())
+        initial_msg = _build_ws_message("updated_schedule", {
+            "tasks": _tasks_to_frontend(active),
+            "swaps": [],
+            "energy": _energy_snapshot(),
+            "timestamp": _utc_now_iso(),
+        })
+        manager.send(ws, initial_msg)
+    except Exception as exc:
+        logger.warning("Initial schedule build failed: %s", exc)
+
+
 @app.websocket("/ws")
 async def websocket_endpoint(ws: WebSocket):
     await manager.connect(ws)
     try:
-        # Send initial schedule on connect
+        # Build and send the initial snapshot without holding up the receive loop
+        _fire_and_forget(_send_initial_schedule(ws))
         r = _get_redis()
-        active = get_active_tasks(r)
-        frontend_tasks = [_task_to_frontend(t) for t in active]
-
-        initial_msg = _build_ws_message("updated_schedule", {
-            "tasks": frontend_tasks,
-            "swaps": [],
-            "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-        })
-        await ws.send_text(initial_msg)
 
         # Keep connection alive, listen for client messages
         while True:
@@ -222,6 +417,7 @@ async def websocket_endpoint(ws: WebSocket):
 
                 if msg_type == "identify":
                     # iOS bridge or other clients identify themselves
+                    manager.set_capabilities(ws, msg.get("capabilities"))
                     logger.info("Client identified: %s (device: %s)",
                                 msg.get("client", "unknown"), msg.get("device_id", ""))
 
@@ -239,11 +435,11 @@ async def websocket_endpoint(ws: WebSocket):
                             r.srem("task:active", task_id)
                             active = get_active_tasks(r)
                             _sts.reorder(active)
-                            frontend_tasks = [_task_to_frontend(t) for t in active]
+                            frontend_tasks = _tasks_to_frontend(active)
                             update_msg = _build_ws_message("updated_schedule", {
                                 "tasks": frontend_tasks, "swaps": [],
-                                "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
+                                "energy": _energy_snapshot(),
+                                "timestamp": _utc_now_iso(),
                             })
                             await manager.broadcast(update_msg)
                             await manager.broadcast_agent_activity(
@@ -255,11 +451,11 @@ async def websocket_endpoint(ws: WebSocket):
                             task.status = TaskStatus.IN_PROGRESS
                             task.to_redis(r)
                             active = get_active_tasks(r)
-                            frontend_tasks = [_task_to_frontend(t) for t in active]
+                            frontend_tasks = _tasks_to_frontend(active)
                             update_msg = _build_ws_message("updated_schedule", {
                                 "tasks": frontend_tasks, "swaps": [],
-                                "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-                                "timestamp": datetime.now(timezone.utc).isoformat(),
+                                "energy": _energy_snapshot(),
+                                "timestamp": _utc_now_iso(),
                             })
                             await manager.broadcast(update_msg)
 
@@ -275,6 +471,10 @@ async def websocket_endpoint(ws: WebSocket):
                 pass
 
     except WebSocketDisconnect:
+        pass
+    finally:
+        # Any exit — client disconnect, a dropped slow client's receive
+        # failing, or a handler error — must release the writer and queue
         manager.disconnect(ws)
 
 
@@ -304,10 +504,11 @@ async def get_schedule():
     r = _get_redis()
     active = get_active_tasks(r)
     backlog = get_backlog_tasks(r)
+    today = _utc_today()
     return {
-        "tasks": [_task_to_frontend(t) for t in active],
-        "backlog": [_task_to_frontend(t) for t in backlog],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
+        "tasks": _tasks_to_frontend(active, today),
+        "backlog": _tasks_to_frontend(backlog, today),
+        "energy": _energy_snapshot(),
         "queue_counts": _sts.queue_counts(),
     }
 
@@ -328,14 +529,14 @@ async def trigger_plan_day(req: PlanDayRequest):
         r=r,
     )
 
-    frontend_tasks = [_task_to_frontend(t) for t in tasks]
+    frontend_tasks = _tasks_to_frontend(tasks)
 
     # Broadcast to all connected clients
     msg = _build_ws_message("updated_schedule", {
         "tasks": frontend_tasks,
         "swaps": [],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "energy": _energy_snapshot(),
+        "timestamp": _utc_now_iso(),
     })
     await manager.broadcast(msg)
 
@@ -385,29 +586,28 @@ async def simulate_disruption(req: DisruptionRequest):
         f"Severity: {severity}."
     )
 
-    # Broadcast disruption event
-    disruption_msg = _build_ws_message("disruption_event", {
-        "severity": severity,
-        "affected_task_ids": req.affected_task_ids,
-        "freed_minutes": freed_minutes,
-        "recommended_action": action,
-        "context_summary": summary,
-    })
-    await manager.broadcast(disruption_msg)
-
-    # Agent activity: Context Sentinel detected the change
-    await manager.broadcast_agent_activity(
-        "Context Sentinel",
-        f"Detected {req.event_type} from {req.source}",
-        "info",
-    )
-
-    # Agent activity: Disruption Detector classified
-    await manager.broadcast_agent_activity(
-        "Disruption Detector",
-        f"Classified as {severity} — {action} ({abs(freed_minutes)}min {'gained' if freed_minutes >= 0 else 'lost'})",
-        "disruption",
-    )
+    # Broadcast disruption event plus detection/classification activity
+    await manager.broadcast_batch([
+        ("disruption_event", {
+            "severity": severity,
+            "affected_task_ids": req.affected_task_ids,
+            "freed_minutes": freed_minutes,
+            "recommended_action": action,
+            "context_summary": summary,
+        }),
+        # Context Sentinel detected the change
+        ("agent_activity", _agent_activity(
+            "Context Sentinel",
+            f"Detected {req.event_type} from {req.source}",
+            "info",
+        )),
+        # Disruption Detector classified
+        ("agent_activity", _agent_activity(
+            "Disruption Detector",
+            f"Classified as {severity} — {action} ({abs(freed_minutes)}min {direction})",
+            "disruption",
+        )),
+    ])
 
     # Step 2: Scheduler Kernel runs MTS
     result = None
@@ -422,14 +622,12 @@ async def simulate_disruption(req: DisruptionRequest):
             r=r,
         )
 
+    # Step 3: Build updated schedule with swap info (one fetch serves both)
+    active = get_active_tasks(r)
+    if result is not None:
         # Rebuild STS with current active tasks
-        active = get_active_tasks(r)
         _sts.reorder(active)
 
-    # Step 3: Build updated schedule with swap info
-    active = get_active_tasks(r)
-    frontend_tasks = [_task_to_frontend(t) for t in active]
-
     swaps = []
     if result:
         for t in result.swapped_in:
@@ -454,38 +652,41 @@ async def simulate_disruption(req: DisruptionRequest):
                 "new_time_slot": None,
             })
 
-    schedule_msg = _build_ws_message("updated_schedule", {
-        "tasks": frontend_tasks,
-        "swaps": swaps,
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    })
-    await manager.broadcast(schedule_msg)
-
-    # Agent activity: Scheduler Kernel completed rescheduling
-    swap_summary_parts = []
-    if result and result.swapped_in:
-        swap_summary_parts.append(f"{len(result.swapped_in)} swapped in")
-    if result and result.swapped_out:
-        swap_summary_parts.append(f"{len(result.swapped_out)} swapped out")
-    if result and result.delegated:
-        swap_summary_parts.append(f"{len(result.delegated)} delegated")
-    swap_text = ", ".join(swap_summary_parts) if swap_summary_parts else "schedule reordered"
-
-    await manager.broadcast_agent_activity(
-        "Scheduler Kernel",
-        f"Rescheduled: {swap_text}. {len(frontend_tasks)} tasks active.",
-        "swap" if swaps else "info",
-    )
+    # Only build the WS payloads when someone is listening
+    if manager.count:
+        events: list[tuple[str, dict]] = [("updated_schedule", {
+            "tasks": _tasks_to_frontend(active),
+            "swaps": swaps,
+            "energy": _energy_snapshot(),
+            "timestamp": _utc_now_iso(),
+        })]
+
+        # Agent activity: Scheduler Kernel completed rescheduling
+        swap_summary_parts = []
+        if result and result.swapped_in:
+            swap_summary_parts.append(f"{len(result.swapped_in)} swapped in")
+        if result and result.swapped_out:
+            swap_summary_parts.append(f"{len(result.swapped_out)} swapped out")
+        if result and result.delegated:
+            swap_summary_parts.append(f"{len(result.delegated)} delegated")
+        swap_text = ", ".join(swap_summary_parts) if swap_summary_parts else "schedule reordered"
+
+        events.append(("agent_activity", _agent_activity(
+            "Scheduler Kernel",
+            f"Rescheduled: {swap_text}. {len(active)} tasks active.",
+            "swap" if swaps else "info",
+        )))
+
+        # Agent activity for individual delegations
+        if result and result.delegated:
+            for t in result.delegated:
+                events.append(("agent_activity", _agent_activity(
+                    "GhostWorker",
+                    f"Task '{t.title}' delegated for autonomous execution",
+                    "delegation",
+                )))
 
-    # Agent activity for individual delegations
-    if result and result.delegated:
-        for t in result.delegated:
-            await manager.broadcast_agent_activity(
-                "GhostWorker",
-                f"Task '{t.title}' delegated for autonomous execution",
-                "delegation",
-            )
+        await manager.broadcast_batch(events)
 
     return {
         "severity": severity,
@@ -493,7 +694,7 @@ async def simulate_disruption(req: DisruptionRequest):
         "action": action,
         "summary": summary,
         "swaps": swaps,
-        "schedule_size": len(frontend_tasks),
+        "schedule_size": len(active),
     }
 
 
@@ -555,7 +756,7 @@ async def get_backlog():
     """Get all backlog tasks."""
     r = _get_redis()
     backlog = get_backlog_tasks(r)
-    return {"tasks": [_task_to_frontend(t) for t in backlog]}
+    return {"tasks": _tasks_to_frontend(backlog)}
 
 
 # ══════════════════════════════════════════════════════════════════════════
@@ -582,12 +783,12 @@ async def complete_task(task_id: str):
     # Rebuild STS and broadcast
     active = get_active_tasks(r)
     _sts.reorder(active)
-    frontend_tasks = [_task_to_frontend(t) for t in active]
+    frontend_tasks = _tasks_to_frontend(active)
     msg = _build_ws_message("updated_schedule", {
         "tasks": frontend_tasks,
         "swaps": [],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "energy": _energy_snapshot(),
+        "timestamp": _utc_now_iso(),
     })
     await manager.broadcast(msg)
     await manager.broadcast_agent_activity(
@@ -608,12 +809,12 @@ async def start_task(task_id: str):
     task.to_redis(r)
 
     active = get_active_tasks(r)
-    frontend_tasks = [_task_to_frontend(t) for t in active]
+    frontend_tasks = _tasks_to_frontend(active)
     msg = _build_ws_message("updated_schedule", {
         "tasks": frontend_tasks,
         "swaps": [],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "energy": _energy_snapshot(),
+        "timestamp": _utc_now_iso(),
     })
     await manager.broadcast(msg)
     await manager.broadcast_agent_activity(
@@ -655,14 +856,15 @@ async def create_task(req: CreateTaskRequest):
     store_task(task, r)
     _sts.enqueue(task)
 
-    frontend_task = _task_to_frontend(task)
+    today = _utc_today()
+    frontend_task = _task_to_frontend(task, today)
 
     active = get_active_tasks(r)
     msg = _build_ws_message("updated_schedule", {
-        "tasks": [_task_to_frontend(t) for t in active],
+        "tasks": _tasks_to_frontend(active, today),
         "swaps": [],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "energy": _energy_snapshot(),
+        "timestamp": _utc_now_iso(),
     })
     await manager.broadcast(msg)
     await manager.broadcast_agent_activity(
@@ -701,10 +903,10 @@ async def delete_task(task_id: str):
     _sts.reorder(active)
 
     msg = _build_ws_message("updated_schedule", {
-        "tasks": [_task_to_frontend(t) for t in active],
+        "tasks": _tasks_to_frontend(active),
         "swaps": [],
-        "energy": {"level": _energy_level, "confidence": 0.5, "source": "time_based"},
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "energy": _energy_snapshot(),
+        "timestamp": _utc_now_iso(),
     })
     await manager.broadcast(msg)
 
@@ -809,11 +1011,11 @@ async def send_email(req: SendEmailRequest):
         bcc=req.bcc,
     )
     # Broadcast agent activity
-    await manager.broadcast_agent_activity(
+    _fire_and_forget(manager.broadcast_agent_activity(
         "GhostWorker",
         f"Email sent to {req.to}: {req.subject}",
         "ghostworker",
-    )
+    ))
     return result
 
 
@@ -890,11 +1092,11 @@ async def create_calendar_event(req: CreateEventRequest):
         timezone_str=req.timezone,
         create_meeting_room=req.create_meeting_room,
     )
-    await manager.broadcast_agent_activity(
+    _fire_and_forget(manager.broadcast_agent_activity(
         "Context Sentinel",
         f"Calendar event created: {req.summary}",
         "info",
-    )
+    ))
     return result
 
 
@@ -928,18 +1130,11 @@ async def get_full_profile():
     r = _get_redis()
 
     # Try cached result first
-    cached = r.get("profiler:last_result")
-    if cached:
-        try:
-            profile_data = json.loads(cached)
-        except (json.JSONDecodeError, TypeError):
-            profile_data = None
-    else:
-        profile_data = None
+    profile_data, tc_raw = _load_profiler_cache(r)
 
     if not profile_data:
         # Compute fresh from local data
-        profile_data = _compute_profiler_fresh(r)
+        profile_data = _compute_profiler_fresh(r, tc_raw)
 
     # Enrich with live LinkedIn data (best-effort)
     try:
@@ -955,16 +1150,36 @@ async def get_full_profile():
     return profile_data
 
 
-def _compute_profiler_fresh(r: redis.Redis) -> dict[str, Any]:
-    """Run the ProfilerEngine on local data files and return the result."""
-    from src.data_pipeline.parsers import (
-        parse_daily_goals,
-        parse_linkedin,
-        parse_twitter,
-        parse_reflections,
-        parse_resume,
-    )
+def _load_profiler_cache(r: redis.Redis) -> tuple[Optional[dict[str, Any]], Optional[str]]:
+    """Fetch the cached profile and raw task completions in one round trip.
+
+    Returns (profile_data, task_completions_raw). profile_data is None on a
+    cache miss or undecodable cache entry; the raw completions are handed to
+    _compute_profiler_fresh so a miss doesn't need a second GET.
+    """
+    pipe = r.pipeline(transaction=False)
+    pipe.get(PROFILER_RESULT_KEY)
+    pipe.get("profiler:task_completions")
+    cached, tc_raw = pipe.execute()
+
+    profile_data = None
+    if cached:
+        try:
+            profile_data = json.loads(cached)
+        except (json.JSONDecodeError, TypeError):
+            profile_data = None
+    return profile_data, tc_raw
+
 
+def _compute_profiler_fresh(
+    r: redis.Redis,
+    task_completions_raw: Optional[str] = None,
+) -> dict[str, Any]:
+    """Run the ProfilerEngine on local data files and return the result.
+
+    task_completions_raw is the JSON string stored at
+    profiler:task_completions, as already fetched by _load_profiler_cache.
+    """
     # Load data from parsers
     daily_goals = parse_daily_goals()
     social_hours: dict[str, list[int]] = {}
@@ -998,9 +1213,8 @@ def _compute_profiler_fresh(r: redis.Redis) -> dict[str, Any]:
     # Task completions from Redis
     task_completions: list[dict[str, Any]] = []
     try:
-        tc_raw = r.get("profiler:task_completions")
-        if tc_raw:
-            task_completions = json.loads(tc_raw)
+        if task_completions_raw:
+            task_completions = json.loads(task_completions_raw)
     except Exception:
         pass
 
@@ -1016,7 +1230,7 @@ def _compute_profiler_fresh(r: redis.Redis) -> dict[str, Any]:
 
     # Cache the result
     try:
-        r.set("profiler:last_result", json.dumps(result), ex=1800)  # 30 min TTL
+        cache_profiler_result(r, result)
     except Exception:
         pass
 
@@ -1032,31 +1246,22 @@ async def get_schedule_intelligence():
     """
     r = _get_redis()
 
-    # Get profiler data
-    cached = r.get("profiler:last_result")
-    profile_data = None
-    if cached:
-        try:
-            profile_data = json.loads(cached)
-        except Exception:
-            pass
-
-    if not profile_data:
-        profile_data = _compute_profiler_fresh(r)
+    # Get profiler data — only the two sections this endpoint reads
+    sections = load_profiler_sections(r, "user_profile", "grouping")
+    if sections is None:
+        profile_data, tc_raw = _load_profiler_cache(r)
+        if not profile_data:
+            profile_data = _compute_profiler_fresh(r, tc_raw)
+        sections = [profile_data.get("user_profile"), profile_data.get("grouping")]
 
-    user_profile = profile_data.get("user_profile", {})
-    grouping = profile_data.get("grouping", {})
+    user_profile = sections[0] or {}
+    grouping = sections[1] or {}
 
     # LTS configuration — how the Long-Term Scheduler scores tasks
     lts_config = {
         "peak_hours": user_profile.get("peak_hours", _peak_hours),
         "estimation_bias_correction": user_profile.get("estimation_bias", 1.0),
-        "scoring_weights": {
-            "deadline_urgency": 0.40,
-            "priority": 0.30,
-            "peak_alignment": 0.15,
-            "duration_efficiency": 0.15,
-        },
+        "scoring_weights": LTS_SCORING_WEIGHTS,
     }
 
     # STS configuration — current MLFQ queue state
@@ -1079,11 +1284,7 @@ async def get_schedule_intelligence():
 
     task_buffer = {
         "bucket_count": TASK_BUCKET_COUNT,
-        "hash_weights": {
-            "deadline_urgency": 0.45,
-            "estimated_execution": 0.30,
-            "preferred_start": 0.25,
-        },
+        "hash_weights": BUFFER_HASH_WEIGHTS,
         "bucket_distribution": bucket_distribution,
     }
 
@@ -1095,9 +1296,7 @@ async def get_schedule_intelligence():
 
     # Count how many active tasks are delegatable
     active = get_active_tasks(r)
-    automatable_types = {"email_reply", "slack_message", "uber_book",
-                         "cancel_appointment", "doc_update", "meeting_reschedule"}
-    auto_count = sum(1 for t in active if t.task_type in automatable_types)
+    auto_count = sum(1 for t in active if t.task_type in _AUTOMATABLE_TYPES)
 
     profiler_influence = {
         "peak_hour_alignment": f"High-cognitive tasks scheduled during {peak_hours}",
@@ -1135,9 +1334,6 @@ class AgentverseSearchRequest(BaseModel):
 @app.post("/api/agentverse/search")
 async def agentverse_search(req: AgentverseSearchRequest):
     """Proxy Agentverse search to keep API key server-side."""
-    import os
-    import httpx
-
     token = os.getenv("AGENTVERSE_API_TOKEN", "")
     if not token:
         return {"agents": [], "error": "AGENTVERSE_API_TOKEN not configured"}
@@ -1206,13 +1402,12 @@ async def execute_draft(draft_id: str, req: DraftExecuteRequest = None):
     r = _get_redis()
     svc = get_composio_service()
 
-    # Read draft from Redis
-    draft_data = r.hgetall(f"ghostworker:draft:{draft_id}")
+    draft = load_draft(r, draft_id) or {}
 
     # Determine email fields
-    to = (req and req.to) or draft_data.get("recipient", "")
-    subject = (req and req.subject) or draft_data.get("subject", "")
-    body = (req and req.body) or draft_data.get("body", "")
+    to = (req and req.to) or draft.get("recipient") or ""
+    subject = (req and req.subject) or draft.get("subject") or ""
+    body = (req and req.body) or draft.get("body") or ""
 
     if not to or not body:
         return {"successful": False, "error": "Missing recipient or body"}
@@ -1222,21 +1417,23 @@ async def execute_draft(draft_id: str, req: DraftExecuteRequest = None):
 
     if result.get("successful", False):
         # Clean up draft from Redis
-        r.delete(f"ghostworker:draft:{draft_id}")
-        r.srem("ghostworker:pending", draft_id)
+        pipe = r.pipeline(transaction=False)
+        pipe.hdel("ghostworker:drafts", draft_id)
+        pipe.srem("ghostworker:pending", draft_id)
+        pipe.execute()
 
-        # Notify WebSocket
-        await manager.broadcast_agent_activity(
+        # Notify WebSocket (don't hold the HTTP response on delivery)
+        _fire_and_forget(manager.broadcast_agent_activity(
             "GhostWorker",
             f"Draft {draft_id} executed — email sent to {to}",
             "ghostworker",
-        )
+        ))
 
         # Publish event for GhostWorker agent
         r.publish("ghostworker:events", json.dumps({
             "event": "draft_executed",
             "draft_id": draft_id,
-            "task_id": draft_data.get("task_id", ""),
+            "task_id": draft.get("task_id", ""),
         }))
 
     return result
@@ -1257,23 +1454,20 @@ async def _ghostworker_event_listener():
     draft_rejected) to the ghostworker:events Redis channel. This listener
     relays them to all connected WebSocket clients.
     """
-    r = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    r = aioredis.Redis.from_url(REDIS_URL, decode_responses=True)
     pubsub = r.pubsub(ignore_subscribe_messages=True)
-    pubsub.subscribe("ghostworker:events")
+    await pubsub.subscribe("ghostworker:events")
     logger.info("GhostWorker event listener started")
 
     try:
-        while True:
-            msg = pubsub.get_message(timeout=1.0)
-            if msg is None:
-                await asyncio.sleep(0.5)
-                continue
+        # Async pubsub: waiting for the next event yields to the event loop
+        async for msg in pubsub.listen():
             if msg["type"] != "message":
                 continue
 
             try:
-                data = json.loads(msg["data"])
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(msg["data"])
+            except (orjson.JSONDecodeError, TypeError):
                 continue
 
             event_type = data.get("event", "")
@@ -1321,8 +1515,9 @@ async def _ghostworker_event_listener():
                 await manager.broadcast(ws_msg)
 
     except asyncio.CancelledError:
-        pubsub.unsubscribe("ghostworker:events")
-        pubsub.close()
+        await pubsub.unsubscribe("ghostworker:events")
+        await pubsub.aclose()
+        await r.aclose()
     except Exception as exc:
         logger.error("GhostWorker event listener error: %s", exc)
 
@@ -1334,23 +1529,20 @@ async def _reminder_event_listener():
     reminder:events Redis channel. This listener relays them to all
     connected WebSocket clients (web dashboard + iOS bridge app).
     """
-    r = redis.Redis.from_url(REDIS_URL, decode_responses=True)
+    r = aioredis.Redis.from_url(REDIS_URL, decode_responses=True)
     pubsub = r.pubsub(ignore_subscribe_messages=True)
-    pubsub.subscribe("reminder:events")
+    await pubsub.subscribe("reminder:events")
     logger.info("Reminder event listener started")
 
     try:
-        while True:
-            msg = pubsub.get_message(timeout=1.0)
-            if msg is None:
-                await asyncio.sleep(0.5)
-                continue
+        # Async pubsub: waiting for the next event yields to the event loop
+        async for msg in pubsub.listen():
             if msg["type"] != "message":
                 continue
 
             try:
-                data = json.loads(msg["data"])
-            except (json.JSONDecodeError, TypeError):
+                data = orjson.loads(msg["data"])
+            except (orjson.JSONDecodeError, TypeError):
                 continue
 
             event_type = data.get("event", "")
@@ -1366,8 +1558,9 @@ async def _reminder_event_listener():
                 )
 
     except asyncio.CancelledError:
-        pubsub.unsubscribe("reminder:events")
-        pubsub.close()
+        await pubsub.unsubscribe("reminder:events")
+        await pubsub.aclose()
+        await r.aclose()
     except Exception as exc:
         logger.error("Reminder event listener error: %s", exc)
 
@@ -1400,12 +1593,10 @@ async def get_ghostworker_drafts():
     """
     r = _get_redis()
     pending_ids = r.smembers("ghostworker:pending")
-    drafts = []
-    for draft_id in pending_ids:
-        draft_data = r.hgetall(f"ghostworker:draft:{draft_id}")
-        if draft_data:
-            drafts.append(draft_data)
-    return {"drafts": drafts}
+    if not pending_ids:
+        return {"drafts": []}
+    # All drafts live in one hash, so a single HMGET fetches the pending ones
+    return {"drafts": load_drafts(r, pending_ids)}
 
 
 class DraftApprovalRequest(BaseModel):
@@ -1421,7 +1612,7 @@ async def approve_draft(draft_id: str, req: DraftApprovalRequest = None):
     r = _get_redis()
 
     # Verify draft exists
-    if not r.exists(f"ghostworker:draft:{draft_id}"):
+    if load_draft(r, draft_id) is None:
         return {"error": "Draft not found"}, 404
 
     approval = {"action": "approve", "draft_id": draft_id}
@@ -1442,7 +1633,7 @@ async def reject_draft(draft_id: str):
     """
     r = _get_redis()
 
-    if not r.exists(f"ghostworker:draft:{draft_id}"):
+    if load_draft(r, draft_id) is None:
         return {"error": "Draft not found"}, 404
 
     rejection = {"action": "reject", "draft_id": draft_id}
@@ -1461,8 +1652,6 @@ async def get_elevenlabs_signed_url():
     Keeps the ELEVENLABS_API_KEY server-side. The frontend uses the returned
     signed URL to open a WebSocket directly to ElevenLabs.
     """
-    import httpx
-
     api_key = ELEVENLABS_API_KEY
     agent_id = ELEVENLABS_AGENT_ID
 
@@ -11,10 +11,17 @@ called with explicit arguments.  Used by:
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any, Callable, Optional
+
+import httpx
 from composio import Composio
 
 from src.config.settings import (
@@ -37,10 +44,96 @@ TOOLKIT_AUTH_CONFIG = {
     "slack": SLACK_AUTH_CONFIG_ID,
 }
 
+# check_connections() results are reused for this long (seconds); the UI
+# polls auth status far more often than accounts are connected.
+CONNECTIONS_CACHE_TTL = 5.0
+
+# Toolkits whose schemas tools.execute() needs loaded before first use.
+# Action slugs are prefixed with their toolkit (GMAIL_SEND_EMAIL -> gmail).
+SCHEMA_TOOLKITS = frozenset({"googlecalendar", "gmail", "linkedin"})
+
+# Fixed error results, returned as-is whenever the service has no API key.
+# Shared across calls — callers must treat them as read-only.
+_ERR_NOT_INIT_KEY: dict[str, Any] = {
+    "successful": False,
+    "error": "Composio not initialized (missing API key)",
+}
+_ERR_NOT_INIT: dict[str, Any] = {"successful": False, "error": "Composio not initialized"}
+_ERR_CONNS_NOT_INIT: dict[str, Any] = {"connections": [], "error": "Composio not initialized"}
+
+# Process-wide SDK clients (by API key) and the schemas already loaded into
+# them, so a recreated ComposioService reuses both instead of refetching.
+_sdk_lock = threading.Lock()
+_SDK_CLIENTS: dict[str, Composio] = {}
+_LOADED_SCHEMAS: set[tuple[str, str, str]] = set()  # (api_key, user_id, toolkit)
+# One lock per schema key, so a slow toolkit fetch only holds up callers
+# waiting on that same toolkit — never other toolkits or client lookups.
+_SCHEMA_LOCKS: dict[tuple[str, str, str], threading.Lock] = {}
+
+
+# One keep-alive connection pool for every SDK request, so tool calls from
+# the server, agents and executor threads skip the per-call TCP+TLS setup.
+_http_client = httpx.Client(
+    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    timeout=httpx.Timeout(60.0, connect=10.0),
+)
+
+
+def _new_sdk_client(api_key: str) -> Composio:
+    try:
+        return Composio(api_key=api_key, http_client=_http_client)
+    except TypeError:
+        # SDK builds without the http_client hook manage their own connections
+        return Composio(api_key=api_key)
+
+
+def _get_sdk_client(api_key: str) -> Composio:
+    with _sdk_lock:
+        client = _SDK_CLIENTS.get(api_key)
+        if client is None:
+            client = _SDK_CLIENTS[api_key] = _new_sdk_client(api_key)
+        return client
+
+
+def _schema_lock(key: tuple[str, str, str]) -> threading.Lock:
+    with _sdk_lock:
+        lock = _SCHEMA_LOCKS.get(key)
+        if lock is None:
+            lock = _SCHEMA_LOCKS[key] = threading.Lock()
+        return lock
+
+
+# The SDK is blocking; async callers (Context Sentinel) run it here so
+# independent polls overlap instead of stalling the event loop.
+_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="composio")
+
+_today_bounds_cache: tuple[date, str, str] | None = None  # (day, start, end)
+
+
+def _today_bounds() -> tuple[str, str]:
+    """ISO start/end of the current UTC day, formatted once per day.
+
+    Context Sentinel polls list_events() with the default range, so
+    consecutive polls reuse the same strings.
+    """
+    global _today_bounds_cache
+    today = datetime.now(timezone.utc).date()
+    cached = _today_bounds_cache
+    if cached is None or cached[0] != today:
+        cached = _today_bounds_cache = (
+            today,
+            datetime(today.year, today.month, today.day, tzinfo=timezone.utc).isoformat(),
+            datetime(today.year, today.month, today.day, 23, 59, 59, tzinfo=timezone.utc).isoformat(),
+        )
+    return cached[1], cached[2]
+
 
 class ComposioService:
     """Direct Composio SDK wrapper — every method is a single tool.execute() call."""
 
+    # Fixed tools.execute() options bound into every action handler
+    _EXECUTE_KWARGS = MappingProxyType({"dangerously_skip_version_check": True})
+
     def __init__(
         self,
         api_key: str | None = None,
@@ -50,39 +143,75 @@ class ComposioService:
         self.user_id = user_id or COMPOSIO_USER_ID
         if not self.api_key:
             logger.warning("COMPOSIO_API_KEY not set — Composio calls will fail")
-        self.composio = Composio(api_key=self.api_key) if self.api_key else None
+        self.composio = _get_sdk_client(self.api_key) if self.api_key else None
+        # action -> tools.execute pre-bound with the action and user_id
+        self._handlers: dict[str, Callable[..., Any]] = {}
+        self._conn_cache: tuple[float, dict[str, Any]] | None = None  # (monotonic, result)
+
+    # ── Helper ────────────────────────────────────────────────────────────
 
-        # Pre-load tool schemas so tools.execute() can find them.
-        # SDK v1.0.0-rc2 requires schemas in _tool_schemas before execute().
-        if self.composio:
+    def _ensure_toolkit(self, action: str) -> bool:
+        """Load the schemas for ``action``'s toolkit on first use.
+
+        SDK v1.0.0-rc2 requires schemas in _tool_schemas before execute().
+        Fetching them lazily keeps construction instant and skips toolkits
+        this process never calls.  Returns False if the load failed.
+        """
+        toolkit = action.split("_", 1)[0].lower()
+        key = (self.api_key, self.user_id, toolkit)
+        if toolkit not in SCHEMA_TOOLKITS or key in _LOADED_SCHEMAS:
+            return True
+        with _schema_lock(key):
+            if key in _LOADED_SCHEMAS:
+                return True
             try:
-                for toolkit in ("googlecalendar", "gmail", "linkedin"):
-                    self.composio.tools.get(
-                        user_id=self.user_id,
-                        toolkits=[toolkit],
-                    )
-                logger.info("Composio tool schemas pre-loaded successfully")
+                self.composio.tools.get(user_id=self.user_id, toolkits=[toolkit])
+                _LOADED_SCHEMAS.add(key)
+                logger.info("Composio %s tool schemas loaded", toolkit)
+                return True
             except Exception as exc:
-                logger.warning("Failed to pre-load Composio tool schemas: %s", exc)
+                logger.warning("Failed to load Composio %s tool schemas: %s", toolkit, exc)
+                return False
 
-    # ── Helper ────────────────────────────────────────────────────────────
+    def _handler(self, action: str) -> Callable[..., Any]:
+        """Return tools.execute bound to ``action``, built once per action.
+
+        Not cached while the toolkit's schemas failed to load, so the next
+        call retries the load.
+        """
+        handler = self._handlers.get(action)
+        if handler is None:
+            handler = functools.partial(
+                self.composio.tools.execute,
+                action,
+                user_id=self.user_id,
+                **self._EXECUTE_KWARGS,
+            )
+            if self._ensure_toolkit(action):
+                self._handlers[action] = handler
+        return handler
 
     def _execute(self, action: str, arguments: dict[str, Any]) -> dict[str, Any]:
         """Execute a single Composio tool action."""
         if not self.composio:
-            return {"successful": False, "error": "Composio not initialized (missing API key)"}
+            return _ERR_NOT_INIT_KEY
+        handler = self._handler(action)
         try:
-            result = self.composio.tools.execute(
-                action,
-                user_id=self.user_id,
-                arguments=arguments,
-                dangerously_skip_version_check=True,
-            )
+            result = handler(arguments=arguments)
             return result if isinstance(result, dict) else {"successful": True, "data": result}
         except Exception as exc:
             logger.exception("Composio execute failed: %s", action)
             return {"successful": False, "error": str(exc)}
 
+    async def _run_async(self, method, /, **kwargs: Any) -> dict[str, Any]:
+        """Run a blocking service method on the shared executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_executor, functools.partial(method, **kwargs))
+
+    async def _a_execute(self, action: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Async variant of _execute()."""
+        return await self._run_async(self._execute, action=action, arguments=arguments)
+
     # ══════════════════════════════════════════════════════════════════════
     # Gmail
     # ══════════════════════════════════════════════════════════════════════
@@ -97,17 +226,14 @@ class ComposioService:
         bcc: str | None = None,
     ) -> dict[str, Any]:
         """Send an email via GMAIL_SEND_EMAIL."""
-        args: dict[str, Any] = {
+        return self._execute("GMAIL_SEND_EMAIL", {
             "recipient_email": to,
             "subject": subject,
             "body": body,
             "is_html": is_html,
-        }
-        if cc:
-            args["cc"] = cc
-        if bcc:
-            args["bcc"] = bcc
-        return self._execute("GMAIL_SEND_EMAIL", args)
+            **({"cc": cc} if cc else {}),
+            **({"bcc": bcc} if bcc else {}),
+        })
 
     def fetch_emails(
         self,
@@ -122,6 +248,10 @@ class ComposioService:
             "include_payload": include_payload,
         })
 
+    async def a_fetch_emails(self, **kwargs: Any) -> dict[str, Any]:
+        """Async variant of fetch_emails()."""
+        return await self._run_async(self.fetch_emails, **kwargs)
+
     def fetch_email_by_id(self, message_id: str) -> dict[str, Any]:
         """Fetch a single email by message ID."""
         return self._execute("GMAIL_FETCH_MESSAGE_BY_MESSAGE_ID", {
@@ -159,11 +289,10 @@ class ComposioService:
         Supports deep past/future with RFC 3339 timestamps.
         Defaults to today if no time range given.
         """
-        now = datetime.now(timezone.utc)
-        if not time_min:
-            time_min = now.replace(hour=0, minute=0, second=0).isoformat()
-        if not time_max:
-            time_max = (now.replace(hour=23, minute=59, second=59)).isoformat()
+        if not time_min or not time_max:
+            day_start, day_end = _today_bounds()
+            time_min = time_min or day_start
+            time_max = time_max or day_end
 
         return self._execute("GOOGLECALENDAR_EVENTS_LIST", {
             "calendar_id": calendar_id,
@@ -172,6 +301,10 @@ class ComposioService:
             "maxResults": max_results,
         })
 
+    async def a_list_events(self, **kwargs: Any) -> dict[str, Any]:
+        """Async variant of list_events()."""
+        return await self._run_async(self.list_events, **kwargs)
+
     def create_event(
         self,
         summary: str,
@@ -185,21 +318,17 @@ class ComposioService:
         create_meeting_room: bool = False,
     ) -> dict[str, Any]:
         """Create a calendar event via GOOGLECALENDAR_CREATE_EVENT."""
-        args: dict[str, Any] = {
+        return self._execute("GOOGLECALENDAR_CREATE_EVENT", {
             "calendar_id": calendar_id,
             "summary": summary,
             "start_datetime": start_datetime,
             "event_duration_hour": duration_hours,
             "event_duration_minutes": duration_minutes,
             "timezone": timezone_str,
-        }
-        if description:
-            args["description"] = description
-        if attendees:
-            args["attendees"] = attendees
-        if create_meeting_room:
-            args["create_meeting_room"] = True
-        return self._execute("GOOGLECALENDAR_CREATE_EVENT", args)
+            **({"description": description} if description else {}),
+            **({"attendees": attendees} if attendees else {}),
+            **({"create_meeting_room": True} if create_meeting_room else {}),
+        })
 
     def find_event(
         self,
@@ -209,16 +338,12 @@ class ComposioService:
         calendar_id: str = "primary",
     ) -> dict[str, Any]:
         """Search calendar events via GOOGLECALENDAR_FIND_EVENT."""
-        now = datetime.now(timezone.utc)
-        args: dict[str, Any] = {
+        return self._execute("GOOGLECALENDAR_FIND_EVENT", {
             "calendar_id": calendar_id,
             "query": query,
-        }
-        if time_min:
-            args["timeMin"] = time_min
-        if time_max:
-            args["timeMax"] = time_max
-        return self._execute("GOOGLECALENDAR_FIND_EVENT", args)
+            **({"timeMin": time_min} if time_min else {}),
+            **({"timeMax": time_max} if time_max else {}),
+        })
 
     # ══════════════════════════════════════════════════════════════════════
     # LinkedIn
@@ -242,7 +367,7 @@ class ComposioService:
         Returns {'redirect_url': str, 'request_id': str} on success.
         """
         if not self.composio:
-            return {"successful": False, "error": "Composio not initialized"}
+            return _ERR_NOT_INIT
 
         auth_config_id = TOOLKIT_AUTH_CONFIG.get(toolkit)
         if not auth_config_id:
@@ -256,6 +381,7 @@ class ComposioService:
                 callback_url=callback_url,
                 allow_multiple=True,
             )
+            self._conn_cache = None
             return {
                 "successful": True,
                 "redirect_url": req.redirect_url,
@@ -266,36 +392,41 @@ class ComposioService:
             return {"successful": False, "error": str(exc)}
 
     def check_connections(self) -> dict[str, Any]:
-        """Check which toolkits have active connections for the current user."""
+        """Check which toolkits have active connections for the current user.
+
+        Successful results are cached for CONNECTIONS_CACHE_TTL seconds.
+        """
         if not self.composio:
-            return {"connections": [], "error": "Composio not initialized"}
+            return _ERR_CONNS_NOT_INIT
+        now = time.monotonic()
+        cached = self._conn_cache
+        if cached is not None and now - cached[0] < CONNECTIONS_CACHE_TTL:
+            return cached[1]
 
         try:
             response = self.composio.connected_accounts.list(
                 user_ids=[self.user_id],
                 statuses=["ACTIVE"],
             )
-            items = []
-            if hasattr(response, "items"):
-                items = response.items
-            else:
+            items = getattr(response, "items", None)
+            if items is None:
+                items = []
                 for key, val in response:
                     if key == "items" and isinstance(val, list):
                         items = val
                         break
-            connections = []
-            for acct in items:
-                toolkit_slug = ""
-                if hasattr(acct, "toolkit") and hasattr(acct.toolkit, "slug"):
-                    toolkit_slug = acct.toolkit.slug
-                created = str(getattr(acct, "created_at", ""))
-                connections.append({
+            connections = [
+                {
                     "id": getattr(acct, "id", ""),
-                    "app": toolkit_slug,
+                    "app": getattr(getattr(acct, "toolkit", None), "slug", ""),
                     "status": getattr(acct, "status", "UNKNOWN"),
-                    "created_at": created,
-                })
-            return {"successful": True, "connections": connections}
+                    "created_at": str(getattr(acct, "created_at", "")),
+                }
+                for acct in items
+            ]
+            result = {"successful": True, "connections": connections}
+            self._conn_cache = (now, result)
+            return result
         except Exception as exc:
             logger.exception("Connection status check failed")
             return {"successful": False, "connections": [], "error": str(exc)}
@@ -303,9 +434,10 @@ class ComposioService:
     def disconnect_account(self, connection_id: str) -> dict[str, Any]:
         """Delete a connected account by its ID."""
         if not self.composio:
-            return {"successful": False, "error": "Composio not initialized"}
+            return _ERR_NOT_INIT
         try:
             self.composio.connected_accounts.delete(connection_id)
+            self._conn_cache = None
             return {"successful": True}
         except Exception as exc:
             logger.exception("Failed to disconnect account %s", connection_id)
@@ -315,11 +447,14 @@ class ComposioService:
 # ── Singleton for shared use across server + agents ───────────────────────
 
 _instance: ComposioService | None = None
+_instance_lock = threading.Lock()
 
 
 def get_composio_service() -> ComposioService:
-    """Return a shared ComposioService singleton."""
+    """Return a shared ComposioService singleton (safe to call from threads)."""
     global _instance
     if _instance is None:
-        _instance = ComposioService()
+        with _instance_lock:
+            if _instance is None:
+                _instance = ComposioService()
     return _instance
@@ -1,22 +1,35 @@
 """Shared test fixtures for the Rewind backend test suite."""
 
+import itertools
 import os
 import pytest
 import fakeredis
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock
 
+import src.models.task as task_module
 from src.models.task import Task, Priority, TaskStatus, BUCKET_COUNT
 
 
 # ── Redis ────────────────────────────────────────────────────────────────
 
-@pytest.fixture
-def r():
-    """Fresh fakeredis instance per test (decode_responses=True like production)."""
+@pytest.fixture(scope="session")
+def _redis_client():
+    """Shared fakeredis instance (decode_responses=True like production)."""
     return fakeredis.FakeRedis(decode_responses=True)
 
 
+@pytest.fixture
+def r(_redis_client):
+    """The session's fakeredis client, emptied before each test that asks for it.
+
+    Tests that never touch Redis don't request ``r`` and pay nothing.
+    """
+    _redis_client.flushall()
+    return _redis_client
+
+
 # ── ASI LLM Config ──────────────────────────────────────────────────────
 
 @pytest.fixture
@@ -31,7 +44,7 @@ def asi_config():
 
 # ── Time Freezing ───────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def frozen_now():
     """Return a fixed 'now' datetime for deterministic scoring tests.
 
@@ -40,29 +53,72 @@ def frozen_now():
     return datetime(2026, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
 
 
+@pytest.fixture(scope="module")
+def _frozen_datetime(frozen_now):
+    """Stand-in for the task module's datetime, built once per test module."""
+    mock_dt = MagicMock()
+    mock_dt.now.return_value = frozen_now
+    mock_dt.fromisoformat = datetime.fromisoformat
+    return mock_dt
+
+
+class _Freezer:
+    """Swaps ``src.models.task.datetime`` for the frozen stand-in while active."""
+
+    def __init__(self, mock_dt):
+        self.mock_dt = mock_dt
+
+    def __enter__(self):
+        self._original = task_module.datetime
+        task_module.datetime = self.mock_dt
+        return self.mock_dt
+
+    def __exit__(self, *args):
+        task_module.datetime = self._original
+
+
 @pytest.fixture
-def freeze_time(frozen_now):
-    """Context-manager fixture that patches datetime.now in the task module.
+def freeze_time(_frozen_datetime, frozen_now):
+    """Context-manager fixture that freezes datetime.now in the task module.
 
     Usage in tests:
-        with freeze_time:
+        with freeze_time as mock_dt:
             score = task.deadline_urgency
+
+    ``mock_dt.now.return_value`` may be rebound inside a test; it is reset
+    to ``frozen_now`` for the next one.
     """
-    class _Freezer:
-        def __enter__(self_):
-            self_._patcher = patch("src.models.task.datetime")
-            mock_dt = self_._patcher.start()
-            mock_dt.now.return_value = frozen_now
-            mock_dt.fromisoformat = datetime.fromisoformat
-            return mock_dt
+    _frozen_datetime.now.return_value = frozen_now
+    return _Freezer(_frozen_datetime)
+
 
-        def __exit__(self_, *args):
-            self_._patcher.stop()
+# ── Task Factories ──────────────────────────────────────────────────────
 
-    return _Freezer()
+def _task_factory():
+    """Build a Task factory with sensible defaults and its own id counter."""
+    _counter = itertools.count(1)
+    defaults = {
+        "description": "A test task",
+        "priority": Priority.P2_NORMAL,
+        "energy_cost": 3,
+        "estimated_duration": 30,
+        "status": TaskStatus.BACKLOG,
+        "task_type": "general",
+        "cognitive_load": 3,
+    }
 
+    def _factory(**overrides):
+        n = next(_counter)
+        return Task(**{
+            **defaults,
+            "task_id": f"test-task-{n}",
+            "title": f"Test Task {n}",
+            "tags": ["test"],  # fresh list, never shared between tasks
+            **overrides,
+        })
+
+    return _factory
 
-# ── Task Factories ──────────────────────────────────────────────────────
 
 @pytest.fixture
 def make_task():
@@ -71,34 +127,15 @@ def make_task():
     Usage:
         task = make_task(title="Write report", priority=Priority.P1_IMPORTANT)
     """
-    _counter = 0
-
-    def _factory(**overrides):
-        nonlocal _counter
-        _counter += 1
-        defaults = {
-            "task_id": f"test-task-{_counter}",
-            "title": f"Test Task {_counter}",
-            "description": "A test task",
-            "priority": Priority.P2_NORMAL,
-            "energy_cost": 3,
-            "estimated_duration": 30,
-            "status": TaskStatus.BACKLOG,
-            "tags": ["test"],
-            "task_type": "general",
-            "cognitive_load": 3,
-        }
-        defaults.update(overrides)
-        return Task(**defaults)
-
-    return _factory
+    return _task_factory()
 
 
-@pytest.fixture
-def sample_backlog(make_task, r):
-    """Seed Redis with a diverse set of backlog tasks and return them."""
+@pytest.fixture(scope="module")
+def _sample_backlog_template():
+    """The sample backlog tasks, constructed once per test module."""
+    make_task = _task_factory()
     now = datetime(2026, 2, 15, 12, 0, 0, tzinfo=timezone.utc)
-    tasks = [
+    return [
         make_task(
             task_id="urgent-1",
             title="Fix production bug",
@@ -152,6 +189,16 @@ def sample_backlog(make_task, r):
             task_type="email_reply",
         ),
     ]
-    for t in tasks:
-        t.to_redis(r)
+
+
+@pytest.fixture
+def sample_backlog(_sample_backlog_template, r):
+    """Seed Redis with a diverse set of backlog tasks and return them.
+
+    Each test gets its own copies of the module's template tasks, so
+    mutations (to_redis stamping updated_at, STS reassigning priority)
+    never leak into later tests.
+    """
+    tasks = [replace(t, tags=list(t.tags)) for t in _sample_backlog_template]
+    Task.bulk_to_redis(tasks, r)
     return tasks
@@ -1,5 +1,7 @@
 """Tests for src.models.messages — uAgents Model serialization roundtrips."""
 
+import json
+
 import pytest
 from src.models.messages import (
     ContextChangeEvent,
@@ -16,22 +18,77 @@ from src.models.messages import (
 )
 
 
+# One instance per wire-roundtrip test, encoded once per module.
+_SAMPLES = [
+    ContextChangeEvent(
+        event_type="meeting_ended_early",
+        source="google_calendar",
+        timestamp="2026-02-15T12:00:00Z",
+        affected_task_ids=["t1", "t2"],
+        metadata={"freed_minutes": 15, "meeting_id": "cal-123"},
+    ),
+    DisruptionEvent(
+        severity="major",
+        affected_task_ids=["t1"],
+        freed_minutes=-30,
+        recommended_action="swap_out",
+        context_summary="Meeting overrun by 30 minutes",
+    ),
+    EnergyLevel(level=4, confidence=0.85, source="inferred"),
+    DelegationTask(
+        task_id="del-1",
+        task_type="email_reply",
+        context={"recipient": "alice@example.com", "tone": "professional"},
+        approval_required=True,
+        max_cost_fet=0.5,
+    ),
+    TaskCompletion(
+        task_id="tc-1",
+        status="executed",
+        result={"confirmation": "Email sent successfully"},
+        cost_fet=0.1,
+    ),
+    ScheduleRequest(action="plan_day", payload={"available_hours": 8}),
+    SwapOperation(
+        action="swap_in",
+        task_id="t1",
+        reason="Fits 15min gap",
+        new_time_slot="2026-02-15T14:00:00Z",
+    ),
+    EnergyQuery(user_id="user-1", timestamp="2026-02-15T12:00:00Z"),
+    ProfileQuery(query_type="full_profile", user_id="user-1"),
+]
+
+
+@pytest.fixture(scope="module")
+def encoded():
+    """Map each model class to its sample instance and ``.json()`` payload."""
+    return {type(m): (m, m.json()) for m in _SAMPLES}
+
+
+@pytest.mark.parametrize("cls", [type(m) for m in _SAMPLES], ids=lambda c: c.__name__)
+def test_parse_raw_roundtrip(encoded, cls):
+    model, data = encoded[cls]
+    assert cls.parse_raw(data) == model
+
+
 class TestContextChangeEvent:
-    def test_roundtrip(self):
-        evt = ContextChangeEvent(
-            event_type="meeting_ended_early",
-            source="google_calendar",
-            timestamp="2026-02-15T12:00:00Z",
-            affected_task_ids=["t1", "t2"],
-            metadata={"freed_minutes": 15, "meeting_id": "cal-123"},
-        )
-        data = evt.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[ContextChangeEvent]
         restored = ContextChangeEvent.parse_raw(data)
         assert restored.event_type == "meeting_ended_early"
         assert restored.source == "google_calendar"
         assert restored.affected_task_ids == ["t1", "t2"]
         assert restored.metadata["freed_minutes"] == 15
 
+    def test_vocabulary_fields_are_interned(self):
+        raw = '{"event_type": "new_email", "source": "gmail", "timestamp": "", ' \
+              '"affected_task_ids": [], "metadata": {}}'
+        a = ContextChangeEvent.parse_raw(raw)
+        b = ContextChangeEvent.parse_raw(raw)
+        assert a.event_type is b.event_type
+        assert a.source is b.source
+
     def test_empty_affected_tasks(self):
         evt = ContextChangeEvent(
             event_type="new_email",
@@ -44,15 +101,8 @@ class TestContextChangeEvent:
 
 
 class TestDisruptionEvent:
-    def test_roundtrip(self):
-        evt = DisruptionEvent(
-            severity="major",
-            affected_task_ids=["t1"],
-            freed_minutes=-30,
-            recommended_action="swap_out",
-            context_summary="Meeting overrun by 30 minutes",
-        )
-        data = evt.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[DisruptionEvent]
         restored = DisruptionEvent.parse_raw(data)
         assert restored.severity == "major"
         assert restored.freed_minutes == -30
@@ -70,9 +120,8 @@ class TestDisruptionEvent:
 
 
 class TestEnergyLevel:
-    def test_roundtrip(self):
-        lvl = EnergyLevel(level=4, confidence=0.85, source="inferred")
-        data = lvl.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[EnergyLevel]
         restored = EnergyLevel.parse_raw(data)
         assert restored.level == 4
         assert restored.confidence == 0.85
@@ -83,6 +132,13 @@ class TestEnergyLevel:
         assert lvl.level == 2
         assert lvl.confidence == 1.0
 
+    def test_frozen_and_hashable(self):
+        a = EnergyLevel(level=3, confidence=0.5, source="time_based")
+        b = EnergyLevel(level=3, confidence=0.5, source="time_based")
+        assert len({a, b}) == 1
+        with pytest.raises(TypeError):
+            a.level = 4
+
 
 class TestUpdatedSchedule:
     def test_roundtrip(self):
@@ -97,12 +153,21 @@ class TestUpdatedSchedule:
             timestamp="2026-02-15T12:00:00Z",
             trigger="disruption",
         )
-        data = sched.json()
-        restored = UpdatedSchedule.parse_raw(data)
+        restored = UpdatedSchedule.parse_bytes_fast(sched.model_bytes())
+        assert restored == sched
         assert len(restored.schedule) == 2
         assert len(restored.swaps) == 1
         assert restored.trigger == "disruption"
 
+    def test_dump_many(self):
+        scheds = [
+            UpdatedSchedule(schedule=[], swaps=[], timestamp=f"2026-02-15T1{i}:00:00Z",
+                            trigger="manual")
+            for i in range(3)
+        ]
+        data = UpdatedSchedule.dump_many(scheds)
+        assert [UpdatedSchedule.parse_obj(d) for d in json.loads(data)] == scheds
+
     def test_empty_schedule(self):
         sched = UpdatedSchedule(
             schedule=[],
@@ -114,15 +179,8 @@ class TestUpdatedSchedule:
 
 
 class TestDelegationTask:
-    def test_roundtrip(self):
-        dt = DelegationTask(
-            task_id="del-1",
-            task_type="email_reply",
-            context={"recipient": "alice@example.com", "tone": "professional"},
-            approval_required=True,
-            max_cost_fet=0.5,
-        )
-        data = dt.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[DelegationTask]
         restored = DelegationTask.parse_raw(data)
         assert restored.task_id == "del-1"
         assert restored.task_type == "email_reply"
@@ -132,40 +190,24 @@ class TestDelegationTask:
 
 
 class TestTaskCompletion:
-    def test_roundtrip(self):
-        tc = TaskCompletion(
-            task_id="tc-1",
-            status="executed",
-            result={"confirmation": "Email sent successfully"},
-            cost_fet=0.1,
-        )
-        data = tc.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[TaskCompletion]
         restored = TaskCompletion.parse_raw(data)
         assert restored.status == "executed"
         assert restored.cost_fet == 0.1
 
 
 class TestScheduleRequest:
-    def test_roundtrip(self):
-        req = ScheduleRequest(
-            action="plan_day",
-            payload={"available_hours": 8},
-        )
-        data = req.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[ScheduleRequest]
         restored = ScheduleRequest.parse_raw(data)
         assert restored.action == "plan_day"
         assert restored.payload["available_hours"] == 8
 
 
 class TestSwapOperation:
-    def test_roundtrip(self):
-        op = SwapOperation(
-            action="swap_in",
-            task_id="t1",
-            reason="Fits 15min gap",
-            new_time_slot="2026-02-15T14:00:00Z",
-        )
-        data = op.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[SwapOperation]
         restored = SwapOperation.parse_raw(data)
         assert restored.action == "swap_in"
         assert restored.task_id == "t1"
@@ -182,23 +224,43 @@ class TestUserProfile:
             estimation_bias=1.2,
             automation_comfort={"email": 0.9},
         )
-        data = profile.json()
-        restored = UserProfile.parse_raw(data)
+        restored = UserProfile.parse_bytes_fast(profile.model_bytes())
+        assert restored == profile
         assert restored.peak_hours == [9, 10, 14, 15]
         assert restored.estimation_bias == 1.2
 
 
 class TestEnergyQuery:
-    def test_roundtrip(self):
-        q = EnergyQuery(user_id="user-1", timestamp="2026-02-15T12:00:00Z")
-        data = q.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[EnergyQuery]
         restored = EnergyQuery.parse_raw(data)
         assert restored.user_id == "user-1"
 
 
 class TestProfileQuery:
-    def test_roundtrip(self):
-        q = ProfileQuery(query_type="full_profile", user_id="user-1")
-        data = q.json()
+    def test_roundtrip(self, encoded):
+        _, data = encoded[ProfileQuery]
         restored = ProfileQuery.parse_raw(data)
         assert restored.query_type == "full_profile"
+
+
+class TestORJSONModel:
+    def test_model_bytes_roundtrip(self):
+        evt = ContextChangeEvent(
+            event_type="new_email",
+            source="gmail",
+            timestamp="2026-02-15T12:00:00Z",
+            affected_task_ids=["t1"],
+            metadata={"subject": "Ünïcode ✓"},
+        )
+        data = evt.model_bytes()
+        assert isinstance(data, bytes)
+        assert data == evt.json().encode()
+        assert ContextChangeEvent.parse_raw(data) == evt
+
+    def test_schema_json_keeps_stdlib_formatting(self):
+        """schema_json(indent=..., sort_keys=...) feeds the uAgents schema
+        digest, so it must still accept stdlib json formatting options."""
+        schema = EnergyLevel.schema_json(indent=None, sort_keys=True)
+        assert schema == json.dumps(EnergyLevel.schema(), sort_keys=True)
+        assert EnergyLevel.build_schema_digest(EnergyLevel).startswith("model:")
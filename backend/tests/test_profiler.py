@@ -20,66 +20,77 @@ from typing import Any
 
 import pytest
 
+from src.agents.profiler_agent import (
+    GroupingFunction,
+    PatternEngine,
+    ProfilerEngine,
+    SentimentAnalyzer,
+    SuccessFunction,
+    TemporalTracker,
+)
+from src.data_pipeline.parsers import parse_daily_goals, parse_reflections, parse_resume
+
 
 # ═══════════════════════════════════════════════════════════════════════════
 # Fixtures
 # ═══════════════════════════════════════════════════════════════════════════
 
-@pytest.fixture
-def sample_daily_goals_dir(tmp_path: Path) -> Path:
-    """Create a temporary directory with sample daily goal markdown files."""
-    d = tmp_path / "daily_goals"
-    d.mkdir()
-
-    (d / "001.md").write_text(
-        "- [x] finish project report\n"
-        "- [x] send email to professor\n"
-        "- [x] gym session\n"
-        "- [ ] review algorithms chapter\n"
-        "\n"
-        "Good day overall, felt productive and focused.\n"
-    )
-
-    (d / "002.md").write_text(
-        "- [ ] geology assignment\n"
-        "- [ ] pay taxes\n"
-        "- [x] X post\n"
-        "- [ ] review and plan ebay work\n"
-        "\n"
-        "Wasted time, got distracted, low effort.\n"
-    )
-
-    (d / "003.md").write_text(
-        "- [x] THRC work -> phase 2 complete\n"
-        "- [x] Python toolbox.py file\n"
-        "- [x] Continue with algorithm analysis book -> chapter 2\n"
-        "- [x] send tanya email\n"
-        "- [x] submit the evalai dataset\n"
-    )
-
-    (d / "004.md").write_text(
-        "- [x] meet blessing\n"
-        "- [x] ebay ML challenge continue -> did some but just did sth else\n"
-        "- [x] communicate with Dr. Ekren\n"
-        "- [ ] do DD for NUAI, BURU\n"
-        "- [ ] continue algorithm practice\n"
-        "\n"
-        "Didn't drink water, too comfortable, wasted time.\n"
-    )
-
-    (d / "005.md").write_text(
-        "- [ ] geology assignment\n"
-        "- [ ] pay taxes\n"
-        "- [ ] open DAO LLC\n"
-    )
-
+_DAILY_GOAL_FILES = {
+    "001.md": (
+        b"- [x] finish project report\n"
+        b"- [x] send email to professor\n"
+        b"- [x] gym session\n"
+        b"- [ ] review algorithms chapter\n"
+        b"\n"
+        b"Good day overall, felt productive and focused.\n"
+    ),
+    "002.md": (
+        b"- [ ] geology assignment\n"
+        b"- [ ] pay taxes\n"
+        b"- [x] X post\n"
+        b"- [ ] review and plan ebay work\n"
+        b"\n"
+        b"Wasted time, got distracted, low effort.\n"
+    ),
+    "003.md": (
+        b"- [x] THRC work -> phase 2 complete\n"
+        b"- [x] Python toolbox.py file\n"
+        b"- [x] Continue with algorithm analysis book -> chapter 2\n"
+        b"- [x] send tanya email\n"
+        b"- [x] submit the evalai dataset\n"
+    ),
+    "004.md": (
+        b"- [x] meet blessing\n"
+        b"- [x] ebay ML challenge continue -> did some but just did sth else\n"
+        b"- [x] communicate with Dr. Ekren\n"
+        b"- [ ] do DD for NUAI, BURU\n"
+        b"- [ ] continue algorithm practice\n"
+        b"\n"
+        b"Didn't drink water, too comfortable, wasted time.\n"
+    ),
+    "005.md": (
+        b"- [ ] geology assignment\n"
+        b"- [ ] pay taxes\n"
+        b"- [ ] open DAO LLC\n"
+    ),
+}
+
+
+@pytest.fixture(scope="session")
+def sample_daily_goals_dir(tmp_path_factory) -> Path:
+    """Create a temporary directory with sample daily goal markdown files.
+
+    Session-scoped: the parsers only read these files, so one copy is shared.
+    """
+    d = tmp_path_factory.mktemp("daily_goals")
+    for name, payload in _DAILY_GOAL_FILES.items():
+        (d / name).write_bytes(payload)
     return d
 
 
-@pytest.fixture
-def sample_reflections_dir(tmp_path: Path) -> Path:
-    d = tmp_path / "reflections"
-    d.mkdir()
+@pytest.fixture(scope="session")
+def sample_reflections_dir(tmp_path_factory) -> Path:
+    d = tmp_path_factory.mktemp("reflections")
     (d / "reflection_1.md").write_text(
         "## (1) Continue Doing\n"
         "- **Deep LLM Research**: Sustaining exploration of transformer architectures\n"
@@ -107,9 +118,9 @@ def sample_reflections_dir(tmp_path: Path) -> Path:
     return d
 
 
-@pytest.fixture
-def sample_resume_file(tmp_path: Path) -> Path:
-    f = tmp_path / "resume.md"
+@pytest.fixture(scope="session")
+def sample_resume_file(tmp_path_factory) -> Path:
+    f = tmp_path_factory.mktemp("resume") / "resume.md"
     f.write_text(
         "# John Doe\n\n"
         "**Professional Experience**\n"
@@ -137,6 +148,10 @@ def sample_resume_file(tmp_path: Path) -> Path:
 
 # ── Reference persona fixtures for exclusive calibration ──
 
+_COMPLETED_TASK = {"text": "", "completed": True, "note": "", "category": "professional"}
+_INCOMPLETE_TASK = {**_COMPLETED_TASK, "completed": False}
+
+
 def _make_daily_goals(rate, count: int = 14, tasks_per_day: int = 5) -> list[dict]:
     """Generate daily goal entries.
 
@@ -158,15 +173,13 @@ def _make_daily_goals(rate, count: int = 14, tasks_per_day: int = 5) -> list[dic
     entries: list[dict] = []
     for d, r in enumerate(rates):
         completed = round(tasks_per_day * r)
-        tasks = (
-            [{"text": f"task_{i}", "completed": True, "note": "", "category": "professional"}
-             for i in range(completed)]
-            + [{"text": f"task_{i}", "completed": False, "note": "", "category": "professional"}
-               for i in range(completed, tasks_per_day)]
-        )
+        tasks = [
+            dict(_COMPLETED_TASK if i < completed else _INCOMPLETE_TASK, text=f"task_{i}")
+            for i in range(tasks_per_day)
+        ]
         entries.append({
             "day_id": f"{d:03d}",
-            "tasks": list(tasks),
+            "tasks": tasks,
             "total_tasks": tasks_per_day,
             "completed_count": completed,
             "completion_rate": r,
@@ -179,6 +192,35 @@ def _make_daily_goals(rate, count: int = 14, tasks_per_day: int = 5) -> list[dic
     return entries
 
 
+# 14-day goal histories for the grouping-function archetype cases, built
+# once at import and shared read-only by every test.
+_ARCHETYPE_GOALS: dict[str, list[dict]] = {
+    # Steadily IMPROVING elite performance (0.80 → 1.0)
+    "compounding": _make_daily_goals(rate=[
+        0.80, 0.82, 0.85, 0.87, 0.90, 0.92, 0.95,
+        0.95, 0.97, 0.97, 1.00, 1.00, 1.00, 1.00,
+    ]),
+    # Solid 85% every single day — but zero slope
+    "reliable": _make_daily_goals(rate=0.85, count=14),
+    # Very low start, volatile, but steep upward trajectory
+    "emerging": _make_daily_goals(rate=[
+        0.05, 0.10, 0.05, 0.20, 0.10, 0.30, 0.15,
+        0.40, 0.45, 0.50, 0.55, 0.60, 0.65, 0.70,
+    ]),
+    "mediocre": _make_daily_goals(rate=0.50, count=14),
+}
+
+
+@pytest.fixture(scope="session")
+def grouping_fn() -> GroupingFunction:
+    return GroupingFunction()
+
+
+@pytest.fixture(scope="session")
+def success_fn() -> SuccessFunction:
+    return SuccessFunction()
+
+
 @pytest.fixture
 def altman_zuck_persona() -> dict:
     """Sam Altman / Zuck: Compounding Builder (X=0.95, Y=0.93)."""
@@ -321,30 +363,25 @@ def daily_goal_entries() -> list[dict[str, Any]]:
 
 class TestParseDailyGoals:
     def test_parses_all_files(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         assert len(entries) == 5
 
     def test_completion_rate(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day1 = next(e for e in entries if e["day_id"] == "001")
         assert day1["completion_rate"] == 0.75
 
     def test_perfect_completion(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day3 = next(e for e in entries if e["day_id"] == "003")
         assert day3["completion_rate"] == 1.0
 
     def test_zero_completion(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day5 = next(e for e in entries if e["day_id"] == "005")
         assert day5["completion_rate"] == 0.0
 
     def test_annotation_parsing(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day3 = next(e for e in entries if e["day_id"] == "003")
         annotated = [t for t in day3["tasks"] if t["note"]]
@@ -352,21 +389,18 @@ class TestParseDailyGoals:
         assert "phase 2 complete" in annotated[0]["note"]
 
     def test_reflection_extraction(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day1 = next(e for e in entries if e["day_id"] == "001")
         assert day1["has_reflection"] is True
         assert "productive" in day1["reflection_text"]
 
     def test_negative_sentiment(self, sample_daily_goals_dir):
-        from src.data_pipeline.parsers import parse_daily_goals
         entries = parse_daily_goals(sample_daily_goals_dir)
         day2 = next(e for e in entries if e["day_id"] == "002")
         assert day2["reflection_sentiment"] == "negative"
         assert day2["reflection_sentiment_score"] < 0
 
     def test_empty_directory(self, tmp_path):
-        from src.data_pipeline.parsers import parse_daily_goals
         d = tmp_path / "empty"
         d.mkdir()
         assert parse_daily_goals(d) == []
@@ -378,12 +412,10 @@ class TestParseDailyGoals:
 
 class TestParseReflections:
     def test_parses_documents(self, sample_reflections_dir):
-        from src.data_pipeline.parsers import parse_reflections
         data = parse_reflections(sample_reflections_dir)
         assert len(data["documents"]) == 2
 
     def test_growth_indicators(self, sample_reflections_dir):
-        from src.data_pipeline.parsers import parse_reflections
         data = parse_reflections(sample_reflections_dir)
         gi = data["growth_indicators"]
         assert gi["continue_count"] == 2
@@ -393,14 +425,12 @@ class TestParseReflections:
         assert gi["needs_development_count"] == 1
 
     def test_self_awareness_score(self, sample_reflections_dir):
-        from src.data_pipeline.parsers import parse_reflections
         data = parse_reflections(sample_reflections_dir)
         score = data["growth_indicators"]["self_awareness_score"]
         assert 0.0 <= score <= 1.0
         assert score > 0.5
 
     def test_growth_velocity(self, sample_reflections_dir):
-        from src.data_pipeline.parsers import parse_reflections
         data = parse_reflections(sample_reflections_dir)
         velocity = data["growth_indicators"]["growth_velocity"]
         assert abs(velocity - 0.6667) < 0.01
@@ -412,35 +442,29 @@ class TestParseReflections:
 
 class TestParseResume:
     def test_quantifications(self, sample_resume_file):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(sample_resume_file)
         assert len(data["quantifications"]) > 0
         values = [q["value"] for q in data["quantifications"]]
         assert any("40" in v for v in values)
 
     def test_publications_count(self, sample_resume_file):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(sample_resume_file)
         assert data["publications_count"] == 2
 
     def test_awards(self, sample_resume_file):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(sample_resume_file)
         assert len(data["awards"]) == 2
 
     def test_scholarships(self, sample_resume_file):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(sample_resume_file)
         assert len(data["scholarships"]) == 2
 
     def test_skills(self, sample_resume_file):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(sample_resume_file)
         assert "Python" in data["skills"]
         assert "React" in data["skills"]
 
     def test_missing_file(self, tmp_path):
-        from src.data_pipeline.parsers import parse_resume
         data = parse_resume(tmp_path / "nonexistent.md")
         assert data["quantifications"] == []
 
@@ -451,21 +475,18 @@ class TestParseResume:
 
 class TestPatternEngine:
     def test_decay_weight(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=0.85)
         assert engine._decay_weight(0) == 1.0
         assert abs(engine._decay_weight(1) - 0.85) < 0.001
         assert abs(engine._decay_weight(2) - 0.7225) < 0.001
 
     def test_apply_decay_recent_weighted_higher(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=0.85)
         result = engine._apply_decay([0.2, 0.2, 0.2, 0.8, 0.8])
         uniform_mean = sum([0.2, 0.2, 0.2, 0.8, 0.8]) / 5
         assert result > uniform_mean  # recency bias pulls toward 0.8
 
     def test_peak_hours_with_social_data(self, daily_goal_entries):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(
             daily_goals=daily_goal_entries,
@@ -477,13 +498,11 @@ class TestPatternEngine:
         assert all(0 <= h <= 23 for h in peaks)
 
     def test_estimation_bias_default(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals()
         assert engine.compute_estimation_bias() == 1.2
 
     def test_estimation_bias_with_data(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(task_completions=[
             {"estimated_minutes": 30, "actual_minutes": 45},
@@ -493,20 +512,17 @@ class TestPatternEngine:
         assert engine.compute_estimation_bias() > 1.0
 
     def test_adherence_score(self, daily_goal_entries):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(daily_goals=daily_goal_entries)
         adherence = engine.compute_adherence_score()
         assert 0.0 <= adherence <= 1.0
 
     def test_drift_direction(self, daily_goal_entries):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(daily_goals=daily_goal_entries)
         assert engine.compute_drift_direction() in ("evening_fade", "distraction", "balanced")
 
     def test_energy_curve_shape(self, daily_goal_entries):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(daily_goals=daily_goal_entries, social_posting_hours={"linkedin": [9, 10]})
         curve = engine.compute_energy_curve()
@@ -514,7 +530,6 @@ class TestPatternEngine:
         assert all(1 <= v <= 5 for v in curve)
 
     def test_full_profile_keys(self, daily_goal_entries):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine()
         engine.load_signals(
             daily_goals=daily_goal_entries,
@@ -533,31 +548,26 @@ class TestPatternEngine:
 
 class TestSentimentAnalyzer:
     def test_positive_text(self):
-        from src.agents.profiler_agent import SentimentAnalyzer
         sa = SentimentAnalyzer()
         result = sa.analyze("Great day, felt productive and motivated!")
         assert result["label"] == "positive"
         assert result["score"] > 0
 
     def test_negative_text(self):
-        from src.agents.profiler_agent import SentimentAnalyzer
         sa = SentimentAnalyzer()
         result = sa.analyze("Wasted time, got distracted, lazy and stressed.")
         assert result["label"] == "negative"
         assert result["score"] < 0
 
     def test_neutral_text(self):
-        from src.agents.profiler_agent import SentimentAnalyzer
         sa = SentimentAnalyzer()
         assert sa.analyze("Completed the task, moved to next one.")["label"] == "neutral"
 
     def test_empty_text(self):
-        from src.agents.profiler_agent import SentimentAnalyzer
         sa = SentimentAnalyzer()
         assert sa.analyze("")["score"] == 0.0
 
     def test_trend_analysis(self):
-        from src.agents.profiler_agent import SentimentAnalyzer
         sa = SentimentAnalyzer()
         texts = [
             "Terrible day, wasted time, stressed and overwhelmed.",
@@ -582,112 +592,62 @@ class TestGroupingFunction:
     Everything else is At Risk — the default.
     """
 
-    def test_compounding_builder_requires_elite_on_both_axes(self):
-        """Only Sam Altman / Zuck tier gets Compounding Builder.
-
-        The data must show BOTH high execution AND a clear upward slope.
-        A constant 0.95 flat-line does NOT qualify because it demonstrates
-        zero growth velocity.  The rates below ramp from 0.80 → 1.0,
-        proving consistent shipping *and* compounding improvement.
-        """
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
-        # 14 days of steadily IMPROVING elite performance (0.80 → 1.0)
-        improving_rates = [
-            0.80, 0.82, 0.85, 0.87, 0.90, 0.92, 0.95,
-            0.95, 0.97, 0.97, 1.00, 1.00, 1.00, 1.00,
-        ]
-        goals = _make_daily_goals(rate=improving_rates)
-        reflection = {"growth_indicators": {"self_awareness_score": 0.9}}
-
-        result = gf.classify(goals, reflection, {})
-        assert result["archetype"] == "compounding_builder", (
-            f"Expected compounding_builder, got {result['archetype']} "
-            f"(exec={result['execution_composite']:.3f}, "
-            f"growth={result['growth_composite']:.3f})"
-        )
-        assert result["execution_composite"] >= 0.85
-        assert result["growth_composite"] >= 0.80
-
-    def test_reliable_operator_ships_but_stagnant(self):
-        """High execution, low growth = Reliable Operator.
-
-        Constant 0.85 completion with near-zero self-awareness.
-        The sigmoid normalization crushes the low self_awareness toward 0,
-        keeping growth_composite < 0.50 while execution stays high.
-        """
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
-        # Ships at a solid 85% every single day — but zero slope, zero depth
-        goals = _make_daily_goals(rate=0.85, count=14)
-        reflection = {"growth_indicators": {"self_awareness_score": 0.1}}
-
-        result = gf.classify(goals, reflection, {})
-        assert result["archetype"] == "reliable_operator", (
-            f"Expected reliable_operator, got {result['archetype']} "
-            f"(exec={result['execution_composite']:.3f}, "
-            f"growth={result['growth_composite']:.3f})"
+    @pytest.mark.parametrize(
+        "goals_key, reflection, expected, exec_range, growth_range",
+        [
+            # Only Sam Altman / Zuck tier: BOTH high execution AND a clear
+            # upward slope.  A flat 0.95 would show zero growth velocity.
+            pytest.param(
+                "compounding", {"self_awareness_score": 0.9},
+                "compounding_builder", (0.85, 1.01), (0.80, 1.01),
+                id="compounding_builder_requires_elite_on_both_axes",
+            ),
+            # Ships 85% every day with near-zero self-awareness; the sigmoid
+            # crushes growth below 0.50 while execution stays high.
+            pytest.param(
+                "reliable", {"self_awareness_score": 0.1},
+                "reliable_operator", (0.70, 1.01), (0.0, 0.50),
+                id="reliable_operator_ships_but_stagnant",
+            ),
+            # Volatile, low output but a steep enough slope that growth
+            # reaches near-ceiling despite crushed execution.
+            pytest.param(
+                "emerging", {"self_awareness_score": 0.95},
+                "emerging_talent", (0.0, 0.50), (0.65, 1.01),
+                id="emerging_talent_learning_fast_but_not_shipping",
+            ),
+            # 50% completion with mediocre growth is NOT enough to escape At Risk.
+            pytest.param(
+                "mediocre", {"self_awareness_score": 0.4, "growth_velocity": 0.4},
+                "at_risk", (0.0, 1.01), (0.0, 1.01),
+                id="mediocre_performer_is_at_risk",
+            ),
+        ],
+    )
+    def test_archetype(self, grouping_fn, goals_key, reflection, expected,
+                       exec_range, growth_range):
+        result = grouping_fn.classify(
+            _ARCHETYPE_GOALS[goals_key], {"growth_indicators": reflection}, {},
         )
-        assert result["execution_composite"] >= 0.70
-        assert result["growth_composite"] < 0.50
-
-    def test_emerging_talent_learning_fast_but_not_shipping(self):
-        """Low execution, high growth = Emerging Talent.
-
-        Volatile, low-output person showing dramatic improvement.
-        The improvement slope must be steep enough that sigmoid-normalized
-        growth_velocity reaches near-ceiling, compensating for the crushed
-        execution dimensions.
-        """
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
-        # Very low start, volatile, but steep upward trajectory
-        improving_rates = [
-            0.05, 0.10, 0.05, 0.20, 0.10, 0.30, 0.15,
-            0.40, 0.45, 0.50, 0.55, 0.60, 0.65, 0.70,
-        ]
-        goals = _make_daily_goals(rate=improving_rates)
-        reflection = {"growth_indicators": {"self_awareness_score": 0.95}}
-
-        result = gf.classify(goals, reflection, {})
-        assert result["archetype"] == "emerging_talent", (
-            f"Expected emerging_talent, got {result['archetype']} "
+        assert result["archetype"] == expected, (
+            f"Expected {expected}, got {result['archetype']} "
             f"(exec={result['execution_composite']:.3f}, "
             f"growth={result['growth_composite']:.3f})"
         )
-        assert result["execution_composite"] < 0.50
-        assert result["growth_composite"] >= 0.65
+        assert exec_range[0] <= result["execution_composite"] < exec_range[1]
+        assert growth_range[0] <= result["growth_composite"] < growth_range[1]
 
-    def test_mixed_signal_defaults_to_at_risk(self, daily_goal_entries):
+    def test_mixed_signal_defaults_to_at_risk(self, grouping_fn, daily_goal_entries):
         """Volatile, mixed data = At Risk. No participation trophies."""
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
-        result = gf.classify(
+        result = grouping_fn.classify(
             daily_goal_entries,
             {"growth_indicators": {"self_awareness_score": 0.4}},
             {},
         )
         assert result["archetype"] == "at_risk"
 
-    def test_mediocre_performer_is_at_risk(self):
-        """50% completion with mediocre growth is NOT enough to escape At Risk."""
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
-        goals = _make_daily_goals(rate=0.50, count=14)
-        reflection = {"growth_indicators": {"self_awareness_score": 0.4, "growth_velocity": 0.4}}
-
-        result = gf.classify(goals, reflection, {})
-        assert result["archetype"] == "at_risk"
-
-    def test_vectors_all_in_range(self, daily_goal_entries):
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-        vectors = gf.compute_vectors(
+    def test_vectors_all_in_range(self, grouping_fn, daily_goal_entries):
+        vectors = grouping_fn.compute_vectors(
             daily_goal_entries,
             {"growth_indicators": {"self_awareness_score": 0.5}},
             {},
@@ -695,13 +655,10 @@ class TestGroupingFunction:
         for key, val in vectors.items():
             assert 0.0 <= val <= 1.0, f"{key}={val} out of range"
 
-    def test_confidence_requires_data(self):
+    def test_confidence_requires_data(self, grouping_fn):
         """< 10 days of data should reduce confidence."""
-        from src.agents.profiler_agent import GroupingFunction
-        gf = GroupingFunction()
-
         few_days = _make_daily_goals(rate=0.95, count=3)
-        result = gf.classify(few_days, {"growth_indicators": {}}, {})
+        result = grouping_fn.classify(few_days, {"growth_indicators": {}}, {})
         assert result["confidence"] < 1.0  # 3/10 = 0.3
 
 
@@ -714,13 +671,11 @@ class TestSuccessFunction:
     the success function places them in the correct quadrant at
     approximately the correct coordinates."""
 
-    def test_altman_zuck_compounding_builder(self, altman_zuck_persona):
+    def test_altman_zuck_compounding_builder(self, success_fn, altman_zuck_persona):
         """Sam Altman / Zuck tier: X~0.95, Y~0.93 -> Compounding Builder."""
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
         p = altman_zuck_persona
 
-        result = sf.compute(
+        result = success_fn.compute(
             p["profile"], {"traits": p["traits"]},
             p["sentiment"], p["engagement_growth"],
         )
@@ -728,13 +683,11 @@ class TestSuccessFunction:
         assert result["execution_velocity"] >= 0.90
         assert result["growth_trajectory"] >= 0.85
 
-    def test_reliable_operator_ships_but_plateaus(self, reliable_operator_persona):
+    def test_reliable_operator_ships_but_plateaus(self, success_fn, reliable_operator_persona):
         """Steady Builder: X~0.86, Y~0.36 -> Reliable Operator."""
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
         p = reliable_operator_persona
 
-        result = sf.compute(
+        result = success_fn.compute(
             p["profile"], {"traits": p["traits"]},
             p["sentiment"], p["engagement_growth"],
         )
@@ -742,13 +695,11 @@ class TestSuccessFunction:
         assert result["execution_velocity"] >= 0.70
         assert result["growth_trajectory"] < 0.50
 
-    def test_emerging_talent_raw_potential(self, emerging_talent_persona):
+    def test_emerging_talent_raw_potential(self, success_fn, emerging_talent_persona):
         """Sporadic Sprinter: X~0.38, Y~0.83 -> Emerging Talent."""
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
         p = emerging_talent_persona
 
-        result = sf.compute(
+        result = success_fn.compute(
             p["profile"], {"traits": p["traits"]},
             p["sentiment"], p["engagement_growth"],
         )
@@ -756,13 +707,11 @@ class TestSuccessFunction:
         assert result["execution_velocity"] < 0.50
         assert result["growth_trajectory"] >= 0.65
 
-    def test_stuck_dreamer_at_risk(self, stuck_dreamer_persona):
+    def test_stuck_dreamer_at_risk(self, success_fn, stuck_dreamer_persona):
         """Stuck Dreamer: X~0.14, Y~0.20 -> At Risk."""
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
         p = stuck_dreamer_persona
 
-        result = sf.compute(
+        result = success_fn.compute(
             p["profile"], {"traits": p["traits"]},
             p["sentiment"], p["engagement_growth"],
         )
@@ -770,12 +719,9 @@ class TestSuccessFunction:
         assert result["execution_velocity"] < 0.30
         assert result["growth_trajectory"] < 0.30
 
-    def test_no_mans_land_falls_to_at_risk(self):
+    def test_no_mans_land_falls_to_at_risk(self, success_fn):
         """Moderate on both axes but not clearing any threshold = At Risk."""
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
-
-        result = sf.compute(
+        result = success_fn.compute(
             {"adherence_score": 0.55, "estimation_bias": 1.3},
             {"traits": {
                 "execution_rate": 0.55, "completion_consistency": 0.55,
@@ -787,11 +733,9 @@ class TestSuccessFunction:
         # Moderate values land in the dead zone between quadrants
         assert result["quadrant"] == "at_risk"
 
-    def test_components_present(self, altman_zuck_persona):
-        from src.agents.profiler_agent import SuccessFunction
-        sf = SuccessFunction()
+    def test_components_present(self, success_fn, altman_zuck_persona):
         p = altman_zuck_persona
-        result = sf.compute(
+        result = success_fn.compute(
             p["profile"], {"traits": p["traits"]}, p["sentiment"],
         )
         assert "components" in result
@@ -807,19 +751,16 @@ class TestSuccessFunction:
 
 class TestTemporalTracker:
     def test_add_snapshot(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker()
         tt.add_snapshot("2025-01-01", {"exec": 0.5, "growth": 0.6})
         assert len(tt.snapshots) == 1
 
     def test_no_drift_with_one_snapshot(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker()
         tt.add_snapshot("2025-01-01", {"exec": 0.5})
         assert tt.detect_drift() is None
 
     def test_drift_detected(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker(drift_threshold=0.15)
         tt.add_snapshot("2025-01-01", {"exec": 0.3, "growth": 0.4})
         tt.add_snapshot("2025-01-02", {"exec": 0.7, "growth": 0.4})
@@ -829,14 +770,12 @@ class TestTemporalTracker:
         assert drift["magnitude"] >= 0.15
 
     def test_no_drift_small_change(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker(drift_threshold=0.15)
         tt.add_snapshot("2025-01-01", {"exec": 0.5, "growth": 0.5})
         tt.add_snapshot("2025-01-02", {"exec": 0.55, "growth": 0.52})
         assert tt.detect_drift() is None
 
     def test_redis_serialization(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker()
         tt.add_snapshot("2025-01-01", {"exec": 0.5})
         tt.add_snapshot("2025-01-02", {"exec": 0.6})
@@ -846,7 +785,6 @@ class TestTemporalTracker:
         assert restored.snapshots[0]["scores"]["exec"] == 0.5
 
     def test_get_trend(self):
-        from src.agents.profiler_agent import TemporalTracker
         tt = TemporalTracker()
         for i in range(10):
             tt.add_snapshot(f"2025-01-{i+1:02d}", {"exec": 0.1 * (i + 1)})
@@ -861,14 +799,12 @@ class TestTemporalTracker:
 
 class TestDecayMath:
     def test_decay_monotonically_decreasing(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=0.85)
         weights = [engine._decay_weight(i) for i in range(10)]
         for i in range(1, len(weights)):
             assert weights[i] <= weights[i - 1]
 
     def test_decay_factor_one_is_no_decay(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=1.0)
         values = [0.5, 0.6, 0.7]
         result = engine._apply_decay(values)
@@ -876,7 +812,6 @@ class TestDecayMath:
         assert abs(result - expected) < 0.001
 
     def test_heavy_decay_favors_recent(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=0.5)
         result = engine._apply_decay([0.0, 0.0, 0.0, 1.0])
         # With decay=0.5, the most recent value (1.0) has weight 1.0
@@ -884,7 +819,6 @@ class TestDecayMath:
         assert result > 0.5
 
     def test_negative_age_clamped(self):
-        from src.agents.profiler_agent import PatternEngine
         engine = PatternEngine(decay_factor=0.85)
         assert engine._decay_weight(-5) == 1.0
 
@@ -895,7 +829,6 @@ class TestDecayMath:
 
 class TestProfilerEngine:
     def test_full_pipeline(self, daily_goal_entries):
-        from src.agents.profiler_agent import ProfilerEngine
 
         engine = ProfilerEngine()
         result = engine.build_full_profile(
@@ -930,7 +863,6 @@ class TestProfilerEngine:
 
     def test_mixed_signal_data_is_at_risk(self, daily_goal_entries):
         """Real-world mixed signal data should NOT clear any elite threshold."""
-        from src.agents.profiler_agent import ProfilerEngine
         engine = ProfilerEngine()
         result = engine.build_full_profile(
             daily_goals=daily_goal_entries,
@@ -941,13 +873,11 @@ class TestProfilerEngine:
 
     def test_empty_data_is_at_risk(self):
         """No data = At Risk by default. Cold start is conservative."""
-        from src.agents.profiler_agent import ProfilerEngine
         engine = ProfilerEngine()
         result = engine.build_full_profile()
         assert result["grouping"]["archetype"] == "at_risk"
 
     def test_temporal_drift_on_second_run(self, daily_goal_entries):
-        from src.agents.profiler_agent import ProfilerEngine
         engine = ProfilerEngine()
         engine.build_full_profile(daily_goals=daily_goal_entries)
         better_goals = [dict(e, completion_rate=0.95) for e in daily_goal_entries]
@@ -7,7 +7,7 @@ without starting a real server. Redis is patched to use fakeredis.
 import json
 import pytest
 import fakeredis
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 from httpx import AsyncClient, ASGITransport
 
 from src.models.task import Task, Priority, TaskStatus
@@ -212,3 +212,132 @@ class TestBacklogEndpoint:
         resp = await client.get("/api/backlog")
         assert resp.status_code == 200
         assert len(resp.json()["tasks"]) == 3
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# Profiler Cache
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestProfilerCache:
+    def test_load_profiler_cache_hit(self, fake_redis):
+        from src.server import _load_profiler_cache
+        fake_redis.set("profiler:last_result", json.dumps({"grouping": {"archetype": "at_risk"}}))
+        fake_redis.set("profiler:task_completions", json.dumps([{"estimated_minutes": 30}]))
+        profile, tc_raw = _load_profiler_cache(fake_redis)
+        assert profile["grouping"]["archetype"] == "at_risk"
+        assert json.loads(tc_raw) == [{"estimated_minutes": 30}]
+
+    def test_load_profiler_cache_miss(self, fake_redis):
+        from src.server import _load_profiler_cache
+        fake_redis.set("profiler:last_result", "not-json")
+        profile, tc_raw = _load_profiler_cache(fake_redis)
+        assert profile is None
+        assert tc_raw is None
+
+    def test_cached_sections_readable_individually(self, fake_redis):
+        from src.agents.profiler_agent import cache_profiler_result, load_profiler_sections
+        result = {
+            "user_profile": {"peak_hours": [9, 10]},
+            "grouping": {"archetype": "at_risk"},
+            "temporal_drift": None,
+        }
+        cache_profiler_result(fake_redis, result)
+        user_profile, grouping = load_profiler_sections(fake_redis, "user_profile", "grouping")
+        assert user_profile == {"peak_hours": [9, 10]}
+        assert grouping == {"archetype": "at_risk"}
+        assert json.loads(fake_redis.get("profiler:last_result")) == result
+        assert 0 < fake_redis.ttl("profiler:last_result") <= 1800
+        assert 0 < fake_redis.ttl("profiler:last_result:sections") <= 1800
+
+    async def test_profiler_agent_writes_shared_cache(self, fake_redis):
+        from src.agents.factory import create_profiler_agent
+        from src.agents.profiler_agent import load_profiler_sections
+        with patch("src.agents.factory.redis.Redis.from_url", return_value=fake_redis):
+            agent = create_profiler_agent(port=18005)
+            for handler in agent._on_startup:
+                await handler(MagicMock())
+
+        blob = json.loads(fake_redis.get("profiler:last_result"))
+        (grouping,) = load_profiler_sections(fake_redis, "grouping")
+        assert grouping == blob["grouping"]
+        # The agent refreshes these itself, so they must not expire between runs
+        assert fake_redis.ttl("profiler:last_result") == -1
+        assert fake_redis.ttl("profiler:last_result:sections") == -1
+
+    def test_missing_sections_returns_none(self, fake_redis):
+        from src.agents.profiler_agent import load_profiler_sections
+        assert load_profiler_sections(fake_redis, "user_profile", "grouping") is None
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# GhostWorker Drafts
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class TestGhostWorkerDrafts:
+    @pytest.mark.asyncio
+    async def test_get_drafts_returns_pending(self, client, fake_redis):
+        for i in range(3):
+            fake_redis.hset("ghostworker:drafts", f"d{i}", json.dumps({"id": f"d{i}", "task_id": f"t{i}"}))
+            fake_redis.sadd("ghostworker:pending", f"d{i}")
+        # Stale pending id with no stored draft is skipped
+        fake_redis.sadd("ghostworker:pending", "gone")
+
+        resp = await client.get("/api/ghostworker/drafts")
+        assert resp.status_code == 200
+        ids = sorted(d["id"] for d in resp.json()["drafts"])
+        assert ids == ["d0", "d1", "d2"]
+
+    @pytest.mark.asyncio
+    async def test_get_drafts_skips_corrupt_entry(self, client, fake_redis):
+        fake_redis.hset("ghostworker:drafts", "ok", json.dumps({"id": "ok"}))
+        fake_redis.hset("ghostworker:drafts", "bad", "{not json")
+        fake_redis.sadd("ghostworker:pending", "ok", "bad")
+
+        resp = await client.get("/api/ghostworker/drafts")
+        assert resp.status_code == 200
+        assert [d["id"] for d in resp.json()["drafts"]] == ["ok"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_draft_hash_is_migrated(self, client, fake_redis):
+        fake_redis.hset("ghostworker:draft:old", mapping={
+            "id": "old", "task_id": "t1", "cost_fet": "0.0", "status": "pending",
+        })
+        fake_redis.sadd("ghostworker:pending", "old")
+
+        resp = await client.post("/api/ghostworker/drafts/old/approve", json={})
+        assert resp.json()["status"] == "approval_sent"
+        migrated = json.loads(fake_redis.hget("ghostworker:drafts", "old"))
+        assert migrated["cost_fet"] == 0.0
+        assert not fake_redis.exists("ghostworker:draft:old")
+
+    @pytest.mark.asyncio
+    async def test_get_drafts_empty(self, client):
+        resp = await client.get("/api/ghostworker/drafts")
+        assert resp.json() == {"drafts": []}
+
+    @pytest.mark.asyncio
+    async def test_execute_draft_uses_stored_fields(self, client, fake_redis):
+        fake_redis.hset("ghostworker:drafts", "d1", json.dumps({
+            "id": "d1", "task_id": "t1", "recipient": "a@example.com",
+            "subject": "Hi", "body": "Hello there",
+        }))
+        fake_redis.sadd("ghostworker:pending", "d1")
+        svc = MagicMock()
+        svc.send_email.return_value = {"successful": True}
+
+        with patch("src.server.get_composio_service", return_value=svc):
+            resp = await client.post("/api/drafts/d1/execute", json={})
+
+        assert resp.json()["successful"] is True
+        svc.send_email.assert_called_once_with(to="a@example.com", subject="Hi", body="Hello there")
+        assert not fake_redis.hexists("ghostworker:drafts", "d1")
+        assert not fake_redis.sismember("ghostworker:pending", "d1")
+
+
+class TestRedisClient:
+    def test_get_redis_is_shared(self):
+        import src.server as server
+        with patch.object(server, "_redis_client", None):
+            assert server._get_redis() is server._get_redis()
@@ -4,6 +4,7 @@ Uses Starlette's TestClient for WebSocket testing and httpx for
 REST endpoints that trigger broadcasts.
 """
 
+import asyncio
 import json
 import pytest
 import fakeredis
@@ -144,3 +145,233 @@ class TestWebSocket:
             msg = json.loads(ws.receive_text())
             assert msg["type"] == "updated_schedule"
             assert "tasks" in msg["payload"]
+
+
+# ═══════════════════════════════════════════════════════════════════════════
+# ConnectionManager
+# ═══════════════════════════════════════════════════════════════════════════
+
+
+class _FakeWS:
+    """Minimal stand-in for a Starlette WebSocket."""
+
+    def __init__(self, fail: bool = False, stall: bool = False):
+        self.fail = fail
+        self.stall = stall
+        self.closed = False
+        self.sent: list[bytes] = []
+        self.text: list[str] = []  # frames that went out as text
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        self.closed = True
+
+    async def send_bytes(self, data: bytes):
+        if self.fail:
+            raise RuntimeError("client gone")
+        if self.stall:
+            await asyncio.Event().wait()
+        self.sent.append(data)
+
+    async def send_text(self, data: str):
+        await self.send_bytes(data.encode())
+        self.text.append(data)
+
+
+async def _settle():
+    """Let writer tasks drain their queues."""
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+async def mgr():
+    from src.server import ConnectionManager
+    manager = ConnectionManager()
+    yield manager
+    for ws in list(manager._connections):
+        manager.disconnect(ws)
+
+
+class TestConnectionManager:
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_all_and_drops_failed(self, mgr):
+        good_a, bad, good_b = _FakeWS(), _FakeWS(fail=True), _FakeWS()
+        for ws in (good_a, bad, good_b):
+            await mgr.connect(ws)
+
+        await mgr.broadcast(b'{"type": "ping"}')
+        await _settle()
+
+        assert good_a.sent == [b'{"type": "ping"}']
+        assert good_b.sent == [b'{"type": "ping"}']
+        assert mgr.count == 2
+
+    @pytest.mark.asyncio
+    async def test_text_frames_unless_client_opts_in_to_binary(self, mgr):
+        text_client, binary_client = _FakeWS(), _FakeWS()
+        await mgr.connect(text_client)
+        await mgr.connect(binary_client)
+        mgr.set_capabilities(binary_client, ["binary"])
+
+        await mgr.broadcast(b'{"type": "ping"}')
+        await _settle()
+
+        assert text_client.text == ['{"type": "ping"}']
+        assert binary_client.sent == [b'{"type": "ping"}']
+        assert binary_client.text == []
+
+    @pytest.mark.asyncio
+    async def test_stalled_client_does_not_block_others(self, mgr):
+        mgr.SEND_QUEUE_SIZE = 2
+        fast, stalled = _FakeWS(), _FakeWS(stall=True)
+        await mgr.connect(fast)
+        await mgr.connect(stalled)
+
+        for i in range(4):
+            await mgr.broadcast(f'{{"n": {i}}}'.encode())
+            await _settle()
+
+        assert len(fast.sent) == 4
+        assert mgr.count == 1
+        assert stalled.closed
+
+    @pytest.mark.asyncio
+    async def test_heartbeat_pings_all_and_drops_failed(self, mgr):
+        mgr.HEARTBEAT_INTERVAL = 0
+        good, bad = _FakeWS(), _FakeWS(fail=True)
+        await mgr.connect(good)
+        await mgr.connect(bad)
+
+        for _ in range(50):
+            if good.sent and mgr.count == 1:
+                break
+            await asyncio.sleep(0.01)
+
+        assert json.loads(good.sent[0]) == {"type": "ping"}
+        assert mgr.count == 1
+
+    @pytest.mark.asyncio
+    async def test_no_clients_skips_encoding(self, mgr):
+        with patch("src.server._build_ws_message") as build:
+            await mgr.broadcast_agent_activity("GhostWorker", "idle")
+            await mgr.broadcast_batch([("energy_update", {"level": 3})])
+        build.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_broadcast_batch_sends_one_frame(self, mgr):
+        ws = _FakeWS()
+        await mgr.connect(ws)
+        mgr.set_capabilities(ws, ["batch"])
+
+        await mgr.broadcast_batch([
+            ("disruption_event", {"severity": "minor"}),
+            ("agent_activity", {"agent": "Context Sentinel", "message": "hi", "type": "info"}),
+        ])
+        await _settle()
+
+        assert len(ws.sent) == 1
+        frame = json.loads(ws.sent[0])
+        assert frame["type"] == "batch"
+        assert [e["type"] for e in frame["payload"]] == ["disruption_event", "agent_activity"]
+        assert all(set(e) == {"type", "payload", "timestamp"} for e in frame["payload"])
+
+
+    @pytest.mark.asyncio
+    async def test_broadcast_batch_individual_frames_by_default(self, mgr):
+        ws = _FakeWS()
+        await mgr.connect(ws)
+
+        await mgr.broadcast_batch([
+            ("updated_schedule", {"tasks": []}),
+            ("agent_activity", {"agent": "Scheduler Kernel", "message": "hi", "type": "info"}),
+        ])
+        await _settle()
+
+        assert [json.loads(f)["type"] for f in ws.text] == ["updated_schedule", "agent_activity"]
+
+
+class TestWebSocketCleanup:
+    @pytest.mark.asyncio
+    async def test_receive_error_releases_writer(self, fake_redis):
+        from src import server
+
+        class _BrokenWS(_FakeWS):
+            async def receive_text(self):
+                raise RuntimeError("socket closed")
+
+        ws = _BrokenWS()
+        with (
+            patch("src.server._get_redis", return_value=fake_redis),
+            patch("src.server.get_active_tasks", return_value=[]),
+        ):
+            with pytest.raises(RuntimeError):
+                await server.websocket_endpoint(ws)
+            await _settle()
+
+        assert server.manager._writers == {}
+
+
+class TestWSMessage:
+    def test_utc_now_iso_cached_per_second(self):
+        from datetime import datetime
+        from src.server import _utc_now_iso
+        with patch("src.server.time.time", return_value=1_771_156_800.25):
+            first = _utc_now_iso()
+        with patch("src.server.time.time", return_value=1_771_156_800.9):
+            assert _utc_now_iso() is first
+        with patch("src.server.time.time", return_value=1_771_156_801.0):
+            later = _utc_now_iso()
+        assert later != first
+        assert datetime.fromisoformat(later).tzinfo is not None
+
+    @pytest.mark.asyncio
+    async def test_agent_activity_frame_format(self, mgr):
+        ws = _FakeWS()
+        await mgr.connect(ws)
+
+        await mgr.broadcast_agent_activity("Scheduler Kernel", 'Moved "Deep work" \u2192 14:00', "swap")
+        await _settle()
+
+        assert json.loads(ws.sent[0])["payload"] == {
+            "agent": "Scheduler Kernel",
+            "message": 'Moved "Deep work" \u2192 14:00',
+            "type": "swap",
+        }
+
+    def test_build_ws_message_uses_given_timestamp(self):
+        from src.server import _build_ws_message
+        msg = json.loads(_build_ws_message("energy_update", {"level": 3}, ts="2026-02-15T12:00:00+00:00"))
+        assert msg["timestamp"] == "2026-02-15T12:00:00+00:00"
+
+
+class TestEventRelay:
+    @pytest.mark.asyncio
+    async def test_reminder_event_relayed_to_ws(self):
+        import fakeredis.aioredis
+        from src import server
+
+        fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        ws = _FakeWS()
+        await server.manager.connect(ws)
+        with patch.object(server.aioredis.Redis, "from_url", return_value=fake):
+            task = asyncio.create_task(server._reminder_event_listener())
+            for _ in range(50):
+                if await fake.publish("reminder:events", json.dumps({
+                    "event": "reminder",
+                    "notification": {"title": "Stand up"},
+                })):
+                    break
+                await asyncio.sleep(0.01)
+            for _ in range(50):
+                if len(ws.sent) >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        server.manager.disconnect(ws)
+
+        types = [json.loads(m)["type"] for m in ws.sent]
+        assert types == ["reminder", "agent_activity"]
@@ -3,6 +3,8 @@
 import { useEffect, useRef, useState, useCallback } from "react";
 import type { WSMessage } from "@/types/schedule";
 
+const textDecoder = new TextDecoder();
+
 type ConnectionStatus = "connecting" | "connected" | "disconnected" | "error";
 
 interface UseWebSocketOptions {
@@ -32,17 +34,32 @@ export function useWebSocket({
 
     setStatus("connecting");
     const ws = new WebSocket(url);
+    // Frames arrive as text until we opt in to binary below
+    ws.binaryType = "arraybuffer";
 
     ws.onopen = () => {
       setStatus("connected");
       reconnectCountRef.current = 0;
+      // Opt in to pre-encoded UTF-8 JSON binary frames and coalesced batches
+      ws.send(JSON.stringify({
+        type: "identify",
+        client: "web-dashboard",
+        capabilities: ["binary", "batch"],
+      }));
     };
 
     ws.onmessage = (event) => {
       try {
-        const message: WSMessage = JSON.parse(event.data);
-        setLastMessage(message);
-        onMessageRef.current?.(message);
+        const raw =
+          typeof event.data === "string" ? event.data : textDecoder.decode(event.data);
+        const message: WSMessage = JSON.parse(raw);
+        // Coalesced frames carry several events; dispatch them in order
+        const events =
+          message.type === "batch" ? (message.payload as WSMessage[]) : [message];
+        for (const ev of events) {
+          setLastMessage(ev);
+          onMessageRef.current?.(ev);
+        }
       } catch {
         console.error("Failed to parse WebSocket message:", event.data);
       }
@@ -72,7 +72,8 @@ export type WSMessageType =
   | "ghost_worker_status"
   | "ghostworker_draft"
   | "agent_activity"
-  | "reminder";
+  | "reminder"
+  | "batch";
 
 export interface WSMessage {
   type: WSMessageType;